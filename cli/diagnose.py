@@ -28,7 +28,7 @@ from engines.symptom_map import (
     SYMPTOMS,
     SYMPTOM_CHECKS,
     SYMPTOM_DESCRIPTIONS,
-    get_fix_suggestion,
+    get_check_info,
     get_resolution_guide,
     match_symptom,
     prioritize_results,
@@ -346,13 +346,11 @@ def _print_validation_result(
     click.echo(click.style(f"                   {result.message}", dim=True))
 
     # Show resolution guide if available, otherwise fall back to fix suggestion
-    guide = get_resolution_guide(result.constraint_id)
+    fix, guide = get_check_info(result.constraint_id)
     if guide:
         _print_resolution_guide(guide)
-    else:
-        fix = get_fix_suggestion(result.constraint_id)
-        if fix:
-            click.echo(click.style(f"                   Fix: {fix}", fg="cyan"))
+    elif fix:
+        click.echo(click.style(f"                   Fix: {fix}", fg="cyan"))
 
     click.echo()
     time.sleep(delay)
@@ -3,15 +3,39 @@
 from __future__ import annotations
 
 import enum
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
+# MCU shorthand as it appears in board names: STM32F405 -> F405, AT32F435 -> F435
+_MCU_SHORT_RE = re.compile(r"(?:STM32|AT32)?([A-Z]\d{3,4})")
+
+
+def _parse_mcu_short(mcu: str) -> str:
+    """Reduce an MCU part number like 'STM32F405' to its board-name shorthand 'F405'."""
+    mcu_upper = mcu.upper()
+    m = _MCU_SHORT_RE.match(mcu_upper)
+    if m:
+        return m.group(1)
+    return mcu_upper.replace("STM32", "").replace("AT32", "")
+
 
 class Severity(enum.Enum):
     CRITICAL = "critical"
     WARNING = "warning"
     INFO = "info"
 
+    rank: int  # sort order, most severe first (CRITICAL=0, WARNING=1, INFO=2)
+
+
+# Set once on the members so sort keys read a plain attribute; the string
+# values stay as-is because templates and JSON use them.
+for _rank, _severity in enumerate(Severity):
+    _severity.rank = _rank
+del _rank, _severity
+
 
 @dataclass
 class Component:
@@ -32,6 +56,30 @@ class Component:
             return getattr(self, path)
         return self.specs.get(path, default)
 
+    # Normalized spec strings, computed once per component and interned so
+    # repeated checks compare cached objects instead of re-casing each time.
+
+    @cached_property
+    def mcu_short(self) -> str:
+        """FC MCU shorthand as used in board names (``STM32F405`` -> ``F405``)."""
+        mcu = self.specs.get("mcu", "")
+        return sys.intern(_parse_mcu_short(mcu)) if mcu else ""
+
+    @cached_property
+    def protocol_upper(self) -> str:
+        """ESC ``protocol`` spec, upper-cased."""
+        return sys.intern(self.specs.get("protocol", "").upper())
+
+    @cached_property
+    def output_protocol_upper(self) -> str:
+        """Receiver ``output_protocol`` spec, upper-cased."""
+        return sys.intern(self.specs.get("output_protocol", "").upper())
+
+    @cached_property
+    def type_lower(self) -> str:
+        """``type`` spec (e.g. VTX ``Digital HD``), lower-cased."""
+        return sys.intern(self.specs.get("type", "").lower())
+
 
 @dataclass
 class Build:
@@ -51,6 +99,16 @@ class Build:
     component_status: dict[str, str] = field(default_factory=dict)
     source_file: str = ""
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Build name normalized for case-insensitive comparison."""
+        return self.name.lower().strip()
+
+    @cached_property
+    def nickname_lower(self) -> str:
+        """Nickname normalized for case-insensitive comparison."""
+        return self.nickname.lower().strip()
+
     @property
     def motor(self) -> Component | None:
         motors = self.components.get("motor")
@@ -82,8 +140,9 @@ class Build:
             return c[0] if c else None
         return c
 
-    @property
+    @cached_property
     def all_up_weight_g(self) -> float:
+        """Sum of all component weights, computed once per build."""
         total = 0.0
         for key, comp in self.components.items():
             if isinstance(comp, list):
@@ -124,9 +183,13 @@ class Constraint:
     message_template: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result of evaluating one constraint against a build."""
+    """Result of evaluating one constraint against a build.
+
+    Frozen so fields cannot be reassigned after a check builds it; ``details``
+    is still a plain dict.
+    """
 
     constraint_id: str
     constraint_name: str
@@ -135,8 +198,13 @@ class ValidationResult:
     message: str
     details: dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def check_id(self) -> str:
+        """ID used for fix lookups and symptom relevance (the constraint ID)."""
+        return self.constraint_id
 
-@dataclass
+
+@dataclass(slots=True)
 class Discrepancy:
     """A detected mismatch between FC config and fleet build record."""
 
@@ -149,3 +217,8 @@ class Discrepancy:
     message: str               # Human-readable explanation
     fix_suggestion: str        # Actionable "how to fix" text
     details: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def check_id(self) -> str:
+        """ID used for fix lookups and symptom relevance (same as ``id``)."""
+        return self.id
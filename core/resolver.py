@@ -7,6 +7,9 @@ from typing import Any
 
 from core.models import Build, Component, Constraint, Severity, ValidationResult
 
+# Dot-path references inside field paths and expressions (e.g. motor.kv).
+_FIELD_PATH_RE = re.compile(r"[a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)+")
+
 
 def resolve_field(path: str, build: Build) -> Any:
     """Resolve a dot-path like 'motor.max_current_a' against a build.
@@ -114,7 +117,7 @@ def _eval_expression(expr: str, build: Build) -> Any:
     Only allows: numbers, +, -, *, /, (), <=, >=, <, >, ==, !=, and, or, not.
     """
     # Find all dot-paths (word.word patterns, possibly with more dots)
-    tokens = re.findall(r"[a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)+", expr)
+    tokens = _FIELD_PATH_RE.findall(expr)
 
     # Deduplicate while preserving order (longest first to avoid partial replacement)
     seen = set()
@@ -150,6 +153,25 @@ def _eval_expression(expr: str, build: Build) -> Any:
         return None
 
 
+def constraint_input_types(constraint: Constraint) -> tuple[str, ...] | None:
+    """Component types whose specs decide *constraint*'s result.
+
+    Covers the required components plus every dot-path referenced by the
+    check. Returns None when the check reads a ``build.`` field, since those
+    depend on the whole build rather than on a few components.
+    """
+    types = dict.fromkeys(constraint.components)
+    for value in constraint.check.values():
+        if not isinstance(value, str):
+            continue
+        for token in _FIELD_PATH_RE.findall(value):
+            comp_type = token.split(".", 1)[0]
+            if comp_type == "build":
+                return None
+            types[comp_type] = None
+    return tuple(types)
+
+
 def evaluate_constraint(constraint: Constraint, build: Build) -> ValidationResult:
     """Evaluate a single constraint against a build. Returns a ValidationResult."""
     # Check if all required components are present
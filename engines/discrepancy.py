@@ -2,37 +2,108 @@
 
 from __future__ import annotations
 
-from typing import Callable
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import NamedTuple, Sequence
 
-from core.models import Build, Discrepancy, Severity
-from engines.firmware_validator import _MOTOR_PROTOCOL_MAP, _SERIALRX_MAP
-from fc_serial.models import FCConfig
+from core.models import Build, Component, Discrepancy, Severity
+from engines.firmware_validator import _MOTOR_COMPAT_PAIRS, _SERIALRX_COMPAT_PAIRS
+from fc_serial.models import FCConfig, SerialPortConfig
+
+
+# ---------------------------------------------------------------------------
+# Per-config snapshot shared by all checks
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class ConfigView:
+    """The FC config signals the discrepancy checks need, extracted once per config."""
+
+    board_name: str
+    serialrx: str               # serialrx_provider as written in the config
+    serialrx_upper: str
+    motor_pwm_upper: str
+    dshot_bidir: str | None
+    craft_name: str
+    vbat_max: int | None        # vbat_max_cell_voltage in centivolts, None if unset/invalid
+    has_gps: bool               # GPS feature or GPS UART
+    has_esc_sensor: bool        # ESC_SENSOR feature or ESC_SENSOR UART
+    # VTX control ports: (SmartAudio, Tramp, VTX_MSP, MSP_DISPLAYPORT)
+    vtx_ports: tuple[
+        SerialPortConfig | None, SerialPortConfig | None,
+        SerialPortConfig | None, SerialPortConfig | None,
+    ]
+    motor_resource_count: int
+
+
+def _config_view(config: FCConfig) -> ConfigView:
+    """Extract every setting the discrepancy checks read from *config*."""
+    ports = config.function_index
+
+    serialrx = config.get_setting("serialrx_provider", "") or ""
+
+    return ConfigView(
+        board_name=config.board_name,
+        serialrx=serialrx,
+        serialrx_upper=serialrx.upper(),
+        motor_pwm_upper=(config.get_setting("motor_pwm_protocol", "") or "").upper(),
+        dshot_bidir=config.get_setting("dshot_bidir"),
+        craft_name=config.craft_name,
+        vbat_max=config.vbat_max_cell_cv,
+        has_gps=config.has_feature("GPS") or "GPS" in ports,
+        has_esc_sensor=config.has_feature("ESC_SENSOR") or "ESC_SENSOR" in ports,
+        vtx_ports=(
+            ports.get("VTX_SMARTAUDIO"),
+            ports.get("VTX_TRAMP"),
+            ports.get("VTX_MSP"),
+            ports.get("MSP_DISPLAYPORT"),
+        ),
+        motor_resource_count=config.motor_resource_count,
+    )
+
+
+class BuildParts(NamedTuple):
+    """The single-instance build components the checks inspect, fetched once per build."""
+
+    fc: Component | None
+    rx: Component | None
+    vtx: Component | None
+    esc: Component | None
+    battery: Component | None
+    gps: Component | None
+
+
+def _build_parts(build: Build) -> BuildParts:
+    get = build.get_component
+    return BuildParts(get("fc"), get("receiver"), get("vtx"), get("esc"), get("battery"), get("gps"))
 
 
 # ---------------------------------------------------------------------------
 # Individual discrepancy checks (disc_001 .. disc_010)
+#
+# Checks that inspect a component assume it is present; detect_discrepancies
+# skips them when the build lacks it.
 # ---------------------------------------------------------------------------
 
 
-def _check_fc_board(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_fc_board(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_001: FC board mismatch — config board_name vs fleet FC MCU."""
-    fc = build.get_component("fc")
-    if not fc:
-        return None
+    fc = parts.fc
 
     fleet_mcu = fc.get("mcu", "")
-    board_name = config.board_name
+    board_name = view.board_name
     if not fleet_mcu or not board_name:
         return None
 
     # Normalise for comparison: e.g. STM32F405 should appear in board_name
     # Board names like "OMNIBUSF4" contain "F4", "MATEKF722" contains "F722"
-    fleet_mcu_upper = fleet_mcu.upper()
     board_upper = board_name.upper()
 
-    # Extract the MCU family shorthand from the fleet MCU spec
+    # MCU family shorthand from the fleet MCU spec
     # STM32F405 → F405, STM32F722 → F722, STM32H743 → H743, AT32F435 → F435
-    mcu_short = fleet_mcu_upper.replace("STM32", "").replace("AT32", "")
+    mcu_short = fc.mcu_short
 
     if mcu_short and mcu_short in board_upper:
         return None
@@ -54,19 +125,16 @@ def _check_fc_board(config: FCConfig, build: Build) -> Discrepancy | None:
     )
 
 
-def _check_receiver_protocol(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_receiver_protocol(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_002: Receiver protocol mismatch — serialrx_provider vs fleet receiver."""
-    rx = build.get_component("receiver")
-    if not rx:
-        return None
+    rx = parts.rx
 
-    fc_serialrx = config.get_setting("serialrx_provider", "")
+    fc_serialrx = view.serialrx
     fleet_protocol = rx.get("output_protocol", "")
     if not fc_serialrx or not fleet_protocol:
         return None
 
-    compatible = _SERIALRX_MAP.get(fc_serialrx.upper(), set())
-    if fleet_protocol in compatible:
+    if (view.serialrx_upper, fleet_protocol) in _SERIALRX_COMPAT_PAIRS:
         return None
 
     return Discrepancy(
@@ -81,37 +149,31 @@ def _check_receiver_protocol(config: FCConfig, build: Build) -> Discrepancy | No
     )
 
 
-def _check_vtx_type(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_vtx_type(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_003: VTX type mismatch — analog (SmartAudio/Tramp) vs digital (MSP)."""
-    vtx = build.get_component("vtx")
-    if not vtx:
-        return None
+    vtx = parts.vtx
 
-    fleet_type = vtx.get("type", "").lower()
+    fleet_type = vtx.type_lower
     if not fleet_type:
         return None
 
-    if not config.serial_ports:
-        return None
-
     fleet_is_digital = "digital" in fleet_type
 
     # Check what the FC config implies
-    has_smartaudio = config.get_serial_port_with_function("VTX_SMARTAUDIO") is not None
-    has_tramp = config.get_serial_port_with_function("VTX_TRAMP") is not None
-    has_vtx_msp = config.get_serial_port_with_function("VTX_MSP") is not None
-    has_msp_dp = config.get_serial_port_with_function("MSP_DISPLAYPORT") is not None
+    smartaudio_port, tramp_port, vtx_msp_port, msp_dp_port = view.vtx_ports
 
-    config_is_analog = has_smartaudio or has_tramp
-    config_is_digital = has_vtx_msp or has_msp_dp
+    config_is_analog = smartaudio_port is not None or tramp_port is not None
+    config_is_digital = vtx_msp_port is not None or msp_dp_port is not None
 
     # No VTX UART configured — can't determine mismatch
     if not config_is_analog and not config_is_digital:
         return None
 
     if fleet_is_digital and config_is_analog and not config_is_digital:
-        analog_fn = "VTX_SMARTAUDIO" if has_smartaudio else "VTX_TRAMP"
-        port = config.get_serial_port_with_function(analog_fn)
+        if smartaudio_port is not None:
+            analog_fn, port = "VTX_SMARTAUDIO", smartaudio_port
+        else:
+            analog_fn, port = "VTX_TRAMP", tramp_port
         port_id = port.port_id if port else "?"
         return Discrepancy(
             id="disc_003",
@@ -139,19 +201,16 @@ def _check_vtx_type(config: FCConfig, build: Build) -> Discrepancy | None:
     return None
 
 
-def _check_motor_protocol(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_motor_protocol(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_004: Motor protocol mismatch — FC motor_pwm_protocol vs ESC spec."""
-    esc = build.get_component("esc")
-    if not esc:
-        return None
+    esc = parts.esc
 
-    fc_protocol = config.get_setting("motor_pwm_protocol", "").upper()
+    fc_protocol = view.motor_pwm_upper
     esc_protocol = esc.get("protocol", "")
     if not fc_protocol or not esc_protocol:
         return None
 
-    compatible = _MOTOR_PROTOCOL_MAP.get(fc_protocol, set())
-    if esc_protocol in compatible:
+    if (fc_protocol, esc_protocol) in _MOTOR_COMPAT_PAIRS:
         return None
 
     return Discrepancy(
@@ -166,15 +225,12 @@ def _check_motor_protocol(config: FCConfig, build: Build) -> Discrepancy | None:
     )
 
 
-def _check_bidir_dshot_firmware(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_bidir_dshot_firmware(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_005: ESC firmware mismatch — bidir DShot implies BLHeli_32/AM32."""
-    bidir = config.get_setting("dshot_bidir")
-    if bidir != "ON":
+    if view.dshot_bidir != "ON":
         return None
 
-    esc = build.get_component("esc")
-    if not esc:
-        return None
+    esc = parts.esc
 
     esc_firmware = esc.get("firmware", "")
     if not esc_firmware:
@@ -195,27 +251,17 @@ def _check_bidir_dshot_firmware(config: FCConfig, build: Build) -> Discrepancy |
     )
 
 
-def _check_battery_cells(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_battery_cells(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_006: Battery cell count mismatch — vbat_max_cell_voltage range vs fleet battery."""
-    battery = build.get_component("battery")
-    if not battery:
-        return None
+    battery = parts.battery
 
     fleet_cells = battery.get("cell_count")
     if not fleet_cells:
         return None
 
     # Check if FC voltage scale suggests a different cell count
-    # We look at vbat_warning_cell_voltage as a cross-check
-    warn_v = config.get_setting("vbat_warning_cell_voltage")
-    max_v = config.get_setting("vbat_max_cell_voltage")
-
-    if not max_v:
-        return None
-
-    try:
-        max_val = int(max_v)
-    except ValueError:
+    max_val = view.vbat_max
+    if max_val is None:
         return None
 
     # Betaflight stores voltage in centivolt (430 = 4.30V)
@@ -255,26 +301,30 @@ def _check_battery_cells(config: FCConfig, build: Build) -> Discrepancy | None:
     return None
 
 
-def _check_craft_name(config: FCConfig, build: Build) -> Discrepancy | None:
+def _either_contains(a: str, b: str) -> bool:
+    """True if either string contains the other (only the shorter can fit in the longer)."""
+    if len(a) <= len(b):
+        return a in b
+    return b in a
+
+
+def _check_craft_name(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_007: Craft name mismatch — FC craft_name vs build name/nickname."""
-    craft_name = config.get_setting("name", "")
-    if not craft_name:
-        # Also try craft_name setting
-        craft_name = config.get_setting("craft_name", "")
+    craft_name = view.craft_name
     if not craft_name:
         return None
 
-    build_name = build.name.lower().strip()
-    build_nickname = build.nickname.lower().strip()
-    craft_lower = craft_name.lower().strip()
+    build_name = build.name_lower
+    build_nickname = build.nickname_lower
+    craft_lower = craft_name.lower()
 
     if craft_lower == build_name or craft_lower == build_nickname:
         return None
 
     # Partial match — craft name contained in build name or vice versa
-    if craft_lower in build_name or build_name in craft_lower:
+    if _either_contains(craft_lower, build_name):
         return None
-    if build_nickname and (craft_lower in build_nickname or build_nickname in craft_lower):
+    if build_nickname and _either_contains(craft_lower, build_nickname):
         return None
 
     return Discrepancy(
@@ -289,26 +339,22 @@ def _check_craft_name(config: FCConfig, build: Build) -> Discrepancy | None:
     )
 
 
-def _check_gps_presence(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_gps_presence(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_008: GPS presence mismatch — FC GPS feature/UART vs fleet GPS component."""
-    fleet_has_gps = build.get_component("gps") is not None
-
-    config_has_gps_feature = config.has_feature("GPS")
-    config_has_gps_uart = config.get_serial_port_with_function("GPS") is not None
-
-    config_has_gps = config_has_gps_feature or config_has_gps_uart
+    gps = parts.gps
+    fleet_has_gps = gps is not None
+    config_has_gps = view.has_gps
 
     if fleet_has_gps == config_has_gps:
         return None
 
     if fleet_has_gps and not config_has_gps:
-        gps = build.get_component("gps")
         return Discrepancy(
             id="disc_008",
             component_type="gps",
             category="feature",
             severity=Severity.INFO,
-            fleet_value=f"GPS: {gps.manufacturer} {gps.model}" if gps else "GPS present",
+            fleet_value=f"GPS: {gps.manufacturer} {gps.model}",
             detected_value="No GPS feature or UART configured",
             message="Fleet has a GPS component but FC has no GPS configured — GPS may have been removed",
             fix_suggestion="If you removed the GPS, remove it from the fleet record. If GPS should be active, enable GPS feature and assign a UART.",
@@ -326,16 +372,12 @@ def _check_gps_presence(config: FCConfig, build: Build) -> Discrepancy | None:
     )
 
 
-def _check_esc_telemetry(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_esc_telemetry(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_009: ESC telemetry mismatch — ESC_SENSOR feature vs fleet ESC current_sensor."""
-    esc = build.get_component("esc")
-    if not esc:
-        return None
+    esc = parts.esc
 
     fleet_has_sensor = esc.get("current_sensor", False)
-    config_has_esc_sensor = config.has_feature("ESC_SENSOR") or (
-        config.get_serial_port_with_function("ESC_SENSOR") is not None
-    )
+    config_has_esc_sensor = view.has_esc_sensor
 
     if fleet_has_sensor == config_has_esc_sensor:
         return None
@@ -364,17 +406,9 @@ def _check_esc_telemetry(config: FCConfig, build: Build) -> Discrepancy | None:
     )
 
 
-def _check_motor_count(config: FCConfig, build: Build) -> Discrepancy | None:
+def _check_motor_count(view: ConfigView, build: Build, parts: BuildParts) -> Discrepancy | None:
     """disc_010: Motor count mismatch — MOTOR resource mappings vs build motor_count."""
-    if not config.resource_mappings:
-        return None
-
-    # Count MOTOR resource entries
-    motor_resources = [
-        k for k in config.resource_mappings
-        if k.startswith("MOTOR ")
-    ]
-    config_motor_count = len(motor_resources)
+    config_motor_count = view.motor_resource_count
 
     if config_motor_count == 0:
         return None
@@ -396,35 +430,65 @@ def _check_motor_count(config: FCConfig, build: Build) -> Discrepancy | None:
     )
 
 
-# ---------------------------------------------------------------------------
-# Check registry
-# ---------------------------------------------------------------------------
-
-ALL_DISCREPANCY_CHECKS: list[Callable[[FCConfig, Build], Discrepancy | None]] = [
-    _check_fc_board,               # disc_001
-    _check_receiver_protocol,      # disc_002
-    _check_vtx_type,               # disc_003
-    _check_motor_protocol,         # disc_004
-    _check_bidir_dshot_firmware,   # disc_005
-    _check_battery_cells,          # disc_006
-    _check_craft_name,             # disc_007
-    _check_gps_presence,           # disc_008
-    _check_esc_telemetry,          # disc_009
-    _check_motor_count,            # disc_010
-]
-
-
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 def detect_discrepancies(config: FCConfig, build: Build) -> list[Discrepancy]:
     """Compare FC config against fleet build, return all detected discrepancies."""
-    discrepancies: list[Discrepancy] = []
+    view = _config_view(config)
+    parts = _build_parts(build)
+
+    # Fixed call sequence (disc_001 .. disc_010) rather than a registry loop;
+    # checks whose component is missing from the build are skipped.
+    results = (
+        _check_fc_board(view, build, parts) if parts.fc else None,
+        _check_receiver_protocol(view, build, parts) if parts.rx else None,
+        _check_vtx_type(view, build, parts) if parts.vtx else None,
+        _check_motor_protocol(view, build, parts) if parts.esc else None,
+        _check_bidir_dshot_firmware(view, build, parts) if parts.esc else None,
+        _check_battery_cells(view, build, parts) if parts.battery else None,
+        _check_craft_name(view, build, parts),
+        _check_gps_presence(view, build, parts),
+        _check_esc_telemetry(view, build, parts) if parts.esc else None,
+        _check_motor_count(view, build, parts),
+    )
+    return [r for r in results if r is not None]
+
+
+# Below this many pairs, worker start-up costs more than the checks themselves.
+_BATCH_PARALLEL_MIN = 64
+_BATCH_CHUNKSIZE = 16
+
+
+def _detect_pair(pair: tuple[FCConfig, Build]) -> list[Discrepancy]:
+    return detect_discrepancies(*pair)
+
+
+def detect_discrepancies_batch(
+    pairs: Sequence[tuple[FCConfig, Build]],
+    workers: int | None = None,
+    use_threads: bool = False,
+) -> list[list[Discrepancy]]:
+    """Run detect_discrepancies over many (config, build) pairs.
+
+    Results are returned in input order. Everything runs inline unless
+    *workers* > 1 is given and the batch has at least 64 pairs; then the pairs
+    are spread over *workers* processes, or over *workers* threads when
+    *use_threads* is set. Threads only run the checks in parallel on a
+    free-threaded interpreter.
+
+    The process pool pickles every config (including its ``raw_text``) and,
+    on spawn platforms (macOS, Windows), re-imports ``__main__``, so a script
+    that asks for processes must guard its entry point with
+    ``if __name__ == "__main__":``.
+    """
+    if workers is None or workers <= 1 or len(pairs) < _BATCH_PARALLEL_MIN:
+        return [detect_discrepancies(config, build) for config, build in pairs]
 
-    for check_fn in ALL_DISCREPANCY_CHECKS:
-        result = check_fn(config, build)
-        if result is not None:
-            discrepancies.append(result)
+    if use_threads:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_detect_pair, pairs))
 
-    return discrepancies
+    with multiprocessing.Pool(processes=workers) as pool:
+        return list(pool.imap(_detect_pair, pairs, chunksize=_BATCH_CHUNKSIZE))
@@ -7,9 +7,10 @@ produce a dict ready for ``save_fleet_drone()``.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, NamedTuple
 
 from core.loader import load_components
+from core.models import Component
 from fc_serial.models import FCConfig
 
 
@@ -25,52 +26,103 @@ _PROTOCOL_ALIASES: dict[str, list[str]] = {
     "PWM": ["PWM"],
 }
 
+# Upper-cased protocol strings an ESC may list for each FC motor_pwm_protocol
+_PROTOCOL_ACCEPTABLE: dict[str, frozenset[str]] = {
+    key: frozenset(a.upper() for a in aliases) | {key}
+    for key, aliases in _PROTOCOL_ALIASES.items()
+}
+
+# Tags derived from firmware identifier and detected VTX type
+_FIRMWARE_TAGS: dict[str, str] = {"BTFL": "betaflight", "INAV": "inav"}
+_VTX_TAGS: dict[str, str] = {"digital": "digital", "analog": "analog"}
+
+
+class _ComponentIndexes(NamedTuple):
+    """Component DB lookups used by the matchers; each maps to the first match in DB order."""
+
+    fc_by_mcu: dict[str, Component]         # MCU shorthand, e.g. "F405"
+    rx_by_protocol: dict[str, Component]    # upper-cased output_protocol, e.g. "CRSF"
+    esc_by_protocol: dict[str, Component]   # upper-cased protocol, e.g. "DSHOT600"
+    vtx_by_type: dict[str, Component]       # "digital" / "analog"
+
+
+# Built from the component DB on first import and reused afterwards.
+_INDEX_CACHE: _ComponentIndexes | None = None
+
+
+def _build_indexes(components: dict[str, list[Component]]) -> _ComponentIndexes:
+    """Index the component DB once so each matcher is a dict lookup."""
+    indexes = _ComponentIndexes({}, {}, {}, {})
+    for comp in components.get("fc", []):
+        if comp.mcu_short:
+            indexes.fc_by_mcu.setdefault(comp.mcu_short, comp)
+    for comp in components.get("receiver", []):
+        if comp.output_protocol_upper:
+            indexes.rx_by_protocol.setdefault(comp.output_protocol_upper, comp)
+    for comp in components.get("esc", []):
+        if comp.protocol_upper:
+            indexes.esc_by_protocol.setdefault(comp.protocol_upper, comp)
+    for comp in components.get("vtx", []):
+        for vtx_type in ("digital", "analog"):
+            if vtx_type in comp.type_lower:
+                indexes.vtx_by_type.setdefault(vtx_type, comp)
+    return indexes
+
+
+def _get_indexes() -> _ComponentIndexes:
+    """Return the component DB indexes, loading the DB from disk on first use."""
+    global _INDEX_CACHE
+    if _INDEX_CACHE is None:
+        _INDEX_CACHE = _build_indexes(load_components())
+    return _INDEX_CACHE
+
+
+def clear_component_cache() -> None:
+    """Drop the cached component DB so the next import re-reads it from disk."""
+    global _INDEX_CACHE
+    _INDEX_CACHE = None
+
+
+def _match_summary(comp: Component | None) -> dict[str, Any] | None:
+    if comp is None:
+        return None
+    return {"id": comp.id, "manufacturer": comp.manufacturer, "model": comp.model}
+
 
-def _match_fc(board_name: str, components: dict[str, list]) -> dict[str, Any] | None:
-    """Match FC board_name against component DB by MCU substring."""
+def _match_fc(board_name: str, fc_by_mcu: dict[str, Component]) -> dict[str, Any] | None:
+    """Match FC board_name against the MCU-shorthand index by substring.
+
+    The index holds one entry per distinct MCU (in DB order), so this scans
+    a handful of keys instead of every FC in the database.
+    """
     if not board_name:
         return None
 
     board_upper = board_name.upper()
-    for comp in components.get("fc", []):
-        mcu = comp.specs.get("mcu", "")
-        if not mcu:
-            continue
-        mcu_short = mcu.upper().replace("STM32", "").replace("AT32", "")
-        if mcu_short and mcu_short in board_upper:
-            return {"id": comp.id, "manufacturer": comp.manufacturer, "model": comp.model}
+    for mcu_short, comp in fc_by_mcu.items():
+        if mcu_short in board_upper:
+            return _match_summary(comp)
     return None
 
 
-def _match_receiver(serialrx_provider: str, components: dict[str, list]) -> dict[str, Any] | None:
+def _match_receiver(serialrx_provider: str, rx_by_protocol: dict[str, Component]) -> dict[str, Any] | None:
     """Match RX protocol (e.g. CRSF) against receiver output_protocol."""
     if not serialrx_provider:
         return None
 
-    provider_upper = serialrx_provider.strip().upper()
-    for comp in components.get("receiver", []):
-        output_proto = comp.specs.get("output_protocol", "")
-        if output_proto and output_proto.upper() == provider_upper:
-            return {"id": comp.id, "manufacturer": comp.manufacturer, "model": comp.model}
-    return None
+    return _match_summary(rx_by_protocol.get(serialrx_provider.strip().upper()))
 
 
-def _match_esc(motor_protocol: str, components: dict[str, list]) -> dict[str, Any] | None:
+def _match_esc(motor_protocol: str, esc_by_protocol: dict[str, Component]) -> dict[str, Any] | None:
     """Match ESC by motor PWM protocol (e.g. DSHOT600)."""
     if not motor_protocol:
         return None
 
     proto_upper = motor_protocol.strip().upper()
-    # Build list of acceptable protocol strings
-    acceptable = {proto_upper}
-    for key, aliases in _PROTOCOL_ALIASES.items():
-        if key == proto_upper:
-            acceptable.update(a.upper() for a in aliases)
-
-    for comp in components.get("esc", []):
-        esc_proto = comp.specs.get("protocol", "")
-        if esc_proto and esc_proto.upper() in acceptable:
-            return {"id": comp.id, "manufacturer": comp.manufacturer, "model": comp.model}
+    for accepted in _PROTOCOL_ACCEPTABLE.get(proto_upper, (proto_upper,)):
+        comp = esc_by_protocol.get(accepted)
+        if comp is not None:
+            return _match_summary(comp)
     return None
 
 
@@ -79,31 +131,25 @@ def _detect_vtx_type(config: FCConfig) -> dict[str, str]:
 
     Returns a dict with 'type' ('digital'/'analog'/'none') and 'detail'.
     """
-    if config.get_serial_port_with_function("VTX_MSP"):
+    ports = config.function_index
+    if "VTX_MSP" in ports:
         return {"type": "digital", "detail": "MSP DisplayPort"}
 
-    if config.get_serial_port_with_function("VTX_SMARTAUDIO"):
+    if "VTX_SMARTAUDIO" in ports:
         return {"type": "analog", "detail": "SmartAudio"}
 
-    if config.get_serial_port_with_function("VTX_TRAMP"):
+    if "VTX_TRAMP" in ports:
         return {"type": "analog", "detail": "IRC Tramp"}
 
     return {"type": "none", "detail": ""}
 
 
-def _match_vtx(vtx_info: dict[str, str], components: dict[str, list]) -> dict[str, Any] | None:
+def _match_vtx(vtx_info: dict[str, str], vtx_by_type: dict[str, Component]) -> dict[str, Any] | None:
     """Match VTX from detected type against component DB."""
     if vtx_info["type"] == "none":
         return None
 
-    for comp in components.get("vtx", []):
-        comp_type = comp.specs.get("type", "").lower()
-        if vtx_info["type"] == "digital" and "digital" in comp_type:
-            return {"id": comp.id, "manufacturer": comp.manufacturer, "model": comp.model}
-        if vtx_info["type"] == "analog" and "analog" in comp_type:
-            return {"id": comp.id, "manufacturer": comp.manufacturer, "model": comp.model}
-
-    return None
+    return _match_summary(vtx_by_type.get(vtx_info["type"]))
 
 
 def _custom_component(component_type: str, detected_id: str, **extra) -> dict[str, Any]:
@@ -122,41 +168,24 @@ def _custom_component(component_type: str, detected_id: str, **extra) -> dict[st
 
 def _extract_craft_name(config: FCConfig) -> str:
     """Get the craft name from config settings."""
-    name = config.get_setting("name", "") or config.get_setting("craft_name", "")
-    return name.strip() if name else ""
+    return config.craft_name
 
 
 def _detect_motor_count(config: FCConfig) -> int:
     """Infer motor count from resource mappings."""
-    motor_keys = [k for k in config.resource_mappings if k.startswith("MOTOR")]
-    return len(motor_keys) if motor_keys else 4
+    return config.motor_resource_count or 4
 
 
 def _build_tags(config: FCConfig, vtx_info: dict[str, str], serialrx: str) -> list[str]:
     """Auto-generate tags from detected config info."""
-    tags: list[str] = []
-
-    # Firmware
-    if config.firmware == "BTFL":
-        tags.append("betaflight")
-    elif config.firmware == "INAV":
-        tags.append("inav")
-
-    # VTX type
-    if vtx_info["type"] == "digital":
-        tags.append("digital")
-    elif vtx_info["type"] == "analog":
-        tags.append("analog")
-
-    # RX protocol
-    if serialrx:
-        tags.append(serialrx.upper())
-
-    # GPS
-    if config.has_feature("GPS") or config.get_serial_port_with_function("GPS"):
-        tags.append("GPS")
-
-    return tags
+    has_gps = config.has_feature("GPS") or "GPS" in config.function_index
+    candidates = (
+        _FIRMWARE_TAGS.get(config.firmware),
+        _VTX_TAGS.get(vtx_info["type"]),
+        serialrx.upper() if serialrx else None,
+        "GPS" if has_gps else None,
+    )
+    return [tag for tag in candidates if tag]
 
 
 def suggest_fleet_drone_from_config(config: FCConfig) -> dict[str, Any]:
@@ -168,7 +197,7 @@ def suggest_fleet_drone_from_config(config: FCConfig) -> dict[str, Any]:
         - Custom inline dicts where no DB match exists
         - ``_detection`` key with match details for display
     """
-    components = load_components()
+    indexes = _get_indexes()
 
     # Extract basic info
     craft_name = _extract_craft_name(config)
@@ -197,10 +226,10 @@ def suggest_fleet_drone_from_config(config: FCConfig) -> dict[str, Any]:
         fw_info += f" on {board_name}"
 
     # Match components
-    fc_match = _match_fc(board_name, components)
-    rx_match = _match_receiver(serialrx, components)
-    esc_match = _match_esc(motor_protocol, components)
-    vtx_match = _match_vtx(vtx_info, components)
+    fc_match = _match_fc(board_name, indexes.fc_by_mcu)
+    rx_match = _match_receiver(serialrx, indexes.rx_by_protocol)
+    esc_match = _match_esc(motor_protocol, indexes.esc_by_protocol)
+    vtx_match = _match_vtx(vtx_info, indexes.vtx_by_type)
 
     # Build detection details for display
     detection: dict[str, Any] = {
@@ -221,53 +250,47 @@ def suggest_fleet_drone_from_config(config: FCConfig) -> dict[str, Any]:
     # Count matched slots
     matched_slots = sum(1 for m in [fc_match, rx_match, esc_match, vtx_match] if m)
 
-    # Build fleet drone dict
-    drone_data: dict[str, Any] = {
+    # Matched component IDs, or a custom fallback when something was detected
+    vtx_type = vtx_info["type"]
+    slots: dict[str, Any] = {
+        "fc": fc_match["id"] if fc_match else (
+            _custom_component(
+                "fc", f"detected_fc_{board_name.lower()}",
+                model=board_name,
+            ) if board_name else None
+        ),
+        "receiver": rx_match["id"] if rx_match else (
+            _custom_component(
+                "receiver", f"detected_rx_{serialrx.lower()}",
+                model=f"Unknown {serialrx} Receiver",
+                specs={"output_protocol": serialrx},
+            ) if serialrx else None
+        ),
+        "esc": esc_match["id"] if esc_match else (
+            _custom_component(
+                "esc", f"detected_esc_{motor_protocol.lower()}",
+                model=f"Unknown {motor_protocol} ESC",
+                specs={"protocol": motor_protocol},
+            ) if motor_protocol else None
+        ),
+        "vtx": vtx_match["id"] if vtx_match else (
+            _custom_component(
+                "vtx", f"detected_vtx_{vtx_type}",
+                model=f"Unknown {vtx_type.title()} VTX ({vtx_info['detail']})",
+                specs={"type": vtx_type.title(), "control": vtx_info["detail"]},
+            ) if vtx_type != "none" else None
+        ),
+    }
+
+    # Build fleet drone dict in one literal; detection metadata is not saved
+    # to fleet JSON, only used for display
+    return {
         "name": drone_name,
         "drone_class": "5inch_freestyle",
         "status": "building",
         "notes": f"Auto-created from FC config: {fw_info}",
         "tags": _build_tags(config, vtx_info, serialrx),
+        **{slot: value for slot, value in slots.items() if value is not None},
+        "_detection": detection,
+        "_matched_slots": matched_slots,
     }
-
-    # Assign matched component IDs (or custom fallback)
-    if fc_match:
-        drone_data["fc"] = fc_match["id"]
-    elif board_name:
-        drone_data["fc"] = _custom_component(
-            "fc", f"detected_fc_{board_name.lower()}",
-            model=board_name,
-        )
-
-    if rx_match:
-        drone_data["receiver"] = rx_match["id"]
-    elif serialrx:
-        drone_data["receiver"] = _custom_component(
-            "receiver", f"detected_rx_{serialrx.lower()}",
-            model=f"Unknown {serialrx} Receiver",
-            specs={"output_protocol": serialrx},
-        )
-
-    if esc_match:
-        drone_data["esc"] = esc_match["id"]
-    elif motor_protocol:
-        drone_data["esc"] = _custom_component(
-            "esc", f"detected_esc_{motor_protocol.lower()}",
-            model=f"Unknown {motor_protocol} ESC",
-            specs={"protocol": motor_protocol},
-        )
-
-    if vtx_match:
-        drone_data["vtx"] = vtx_match["id"]
-    elif vtx_info["type"] != "none":
-        drone_data["vtx"] = _custom_component(
-            "vtx", f"detected_vtx_{vtx_info['type']}",
-            model=f"Unknown {vtx_info['type'].title()} VTX ({vtx_info['detail']})",
-            specs={"type": f"{vtx_info['type'].title()}", "control": vtx_info["detail"]},
-        )
-
-    # Attach detection metadata (not saved to fleet JSON, used for display)
-    drone_data["_detection"] = detection
-    drone_data["_matched_slots"] = matched_slots
-
-    return drone_data
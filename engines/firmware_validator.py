@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Callable
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, NamedTuple
 
-from core.models import Build, Severity, ValidationResult
+from core.models import Build, Component, Severity, ValidationResult
 from engines.compatibility import ValidationReport
-from fc_serial.models import FCConfig
+from fc_serial.config_parser import BTFL_SERIAL_FUNCTIONS, INAV_SERIAL_FUNCTIONS
+from fc_serial.models import FCConfig, SerialPortConfig
 
 
 # ---------------------------------------------------------------------------
@@ -14,30 +18,204 @@ from fc_serial.models import FCConfig
 # ---------------------------------------------------------------------------
 
 # Map FC motor_pwm_protocol setting values to ESC protocol spec values
-_MOTOR_PROTOCOL_MAP: dict[str, set[str]] = {
-    "DSHOT600": {"DShot600", "DShot1200"},
-    "DSHOT300": {"DShot300", "DShot600", "DShot1200"},
-    "DSHOT150": {"DShot150", "DShot300", "DShot600", "DShot1200"},
-    "DSHOT1200": {"DShot1200"},
-    "MULTISHOT": {"Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"},
-    "ONESHOT125": {"Oneshot125", "Oneshot42", "Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"},
-    "ONESHOT42": {"Oneshot42", "Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"},
-    "PWM": {"PWM", "Oneshot125", "Oneshot42", "Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"},
+_MOTOR_PROTOCOL_MAP: dict[str, frozenset[str]] = {
+    "DSHOT600": frozenset({"DShot600", "DShot1200"}),
+    "DSHOT300": frozenset({"DShot300", "DShot600", "DShot1200"}),
+    "DSHOT150": frozenset({"DShot150", "DShot300", "DShot600", "DShot1200"}),
+    "DSHOT1200": frozenset({"DShot1200"}),
+    "MULTISHOT": frozenset({"Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"}),
+    "ONESHOT125": frozenset({"Oneshot125", "Oneshot42", "Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"}),
+    "ONESHOT42": frozenset({"Oneshot42", "Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"}),
+    "PWM": frozenset({"PWM", "Oneshot125", "Oneshot42", "Multishot", "DShot150", "DShot300", "DShot600", "DShot1200"}),
 }
 
 # Map FC serialrx_provider values to receiver output_protocol spec values
-_SERIALRX_MAP: dict[str, set[str]] = {
-    "CRSF": {"CRSF"},
-    "SBUS": {"SBUS"},
-    "IBUS": {"IBUS"},
-    "SPEKTRUM1024": {"DSMX", "DSM2"},
-    "SPEKTRUM2048": {"DSMX", "DSM2"},
-    "SUMD": {"SUMD"},
-    "SUMH": {"SUMH"},
-    "FPORT": {"FPORT"},
-    "GHST": {"GHST"},
+_SERIALRX_MAP: dict[str, frozenset[str]] = {
+    "CRSF": frozenset({"CRSF"}),
+    "SBUS": frozenset({"SBUS"}),
+    "IBUS": frozenset({"IBUS"}),
+    "SPEKTRUM1024": frozenset({"DSMX", "DSM2"}),
+    "SPEKTRUM2048": frozenset({"DSMX", "DSM2"}),
+    "SUMD": frozenset({"SUMD"}),
+    "SUMH": frozenset({"SUMH"}),
+    "FPORT": frozenset({"FPORT"}),
+    "GHST": frozenset({"GHST"}),
 }
 
+# The maps above flattened to (FC setting value, component protocol) pairs,
+# so a compatibility check is a single membership test
+_MOTOR_COMPAT_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (fc_value, proto) for fc_value, protos in _MOTOR_PROTOCOL_MAP.items() for proto in protos
+)
+_SERIALRX_COMPAT_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (fc_value, proto) for fc_value, protos in _SERIALRX_MAP.items() for proto in protos
+)
+
+
+# Every master setting read by a check; snapshotted once per validation
+_CTX_SETTINGS = (
+    "motor_pwm_protocol",
+    "dshot_bidir",
+    "serialrx_provider",
+    "serialrx_inverted",
+    "vtx_table_bands",
+    "vbat_min_cell_voltage",
+    "vbat_max_cell_voltage",
+    "pid_process_denom",
+    "gyro_lpf1_static_hz",
+    "rpm_filter_harmonics",
+    "nav_mc_vel_xy_max",
+    "platform_type",
+)
+
+
+# Settings compared case-insensitively; stored upper-cased and interned so
+# the equality tests against the constants below hit the identity fast path.
+_UPPER_SETTINGS = ("motor_pwm_protocol", "serialrx_provider")
+
+_ON = sys.intern("ON")
+_DSHOT1200 = sys.intern("DSHOT1200")
+_SBUS = sys.intern("SBUS")
+_BLHELI_S = sys.intern("BLHeli_S")
+_BIDIR_CAPABLE_FW = frozenset({sys.intern("BLHeli_32"), sys.intern("AM32")})
+
+# F4 MCUs without hardware UART inversion
+_F4_MCUS = ("F405", "F411")
+
+
+# Digital systems that draw their OSD over MSP DisplayPort, matched as words
+# of the VTX "system" spec (e.g. "DJI O3", "Walksnail Avatar").
+_DIGITAL_VTX_TOKENS = frozenset({"dji", "hdzero", "walksnail", "avatar"})
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+# Serial function categories for fw_018. Functions sharing a VTX_ or
+# TELEMETRY_ prefix conflict with each other; SERIAL_RX conflicts with GPS.
+_CAT_VTX = 1
+_CAT_TELEMETRY = 2
+_CAT_RX = 4
+_CAT_GPS = 8
+_CAT_SHARED_PREFIX = _CAT_VTX | _CAT_TELEMETRY
+_CAT_RX_GPS = _CAT_RX | _CAT_GPS
+
+
+def _function_category(func: str) -> int:
+    if func.startswith("VTX_"):
+        return _CAT_VTX
+    if func.startswith("TELEMETRY_"):
+        return _CAT_TELEMETRY
+    if func == "SERIAL_RX":
+        return _CAT_RX
+    if func == "GPS":
+        return _CAT_GPS
+    return 0
+
+
+_FUNC_CATEGORY: dict[str, int] = {
+    func: _function_category(func)
+    for table in (BTFL_SERIAL_FUNCTIONS, INAV_SERIAL_FUNCTIONS)
+    for func in table.values()
+}
+
+
+@dataclass(slots=True)
+class _Ctx:
+    """Components and settings the checks read, looked up once per validation.
+
+    Filled by _populate(); a batch run refills one instance for every pair.
+    """
+
+    config: FCConfig
+    fc: Component | None
+    esc: Component | None
+    vtx: Component | None
+    rx: Component | None
+    battery: Component | None
+    settings: dict[str, str]  # _CTX_SETTINGS values, "" when unset
+    ints: dict[str, int | None]  # FCConfig.int_settings
+    firmware: str
+    drone_class: str
+    is_whoop: bool
+    is_7inch: bool
+    is_long_range: bool  # 7inch or an "lr" class
+    is_f4: bool  # FC MCU is one of _F4_MCUS
+    vtx_type: str  # lower-cased VTX "type" spec, "" without a VTX
+    vtx_system: str  # lower-cased VTX "system" spec, "" without a VTX
+    vtx_is_digital: bool
+    # Component specs the checks read, snapshotted with their check-time
+    # defaults ("" / False / None) so checks need no dict lookups
+    esc_firmware: str
+    esc_protocol: str
+    esc_has_current_sensor: bool
+    fc_mcu: str
+    fc_osd: str
+    rx_protocol: str
+    rx_has_telemetry: bool
+    battery_cell_count: Any
+    func_to_port: dict[str, SerialPortConfig]  # function -> first port carrying it
+    active_ports: list[tuple[int, list[str]]]  # (port_id, functions other than UNUSED)
+
+
+def _populate(ctx: _Ctx, config: FCConfig, build: Build) -> _Ctx:
+    """Fill *ctx* in place for one (config, build) pair and return it."""
+    drone_class = build.drone_class
+    is_7inch = "7inch" in drone_class
+    settings = {key: config.get_setting(key, "") for key in _CTX_SETTINGS}
+    for key in _UPPER_SETTINGS:
+        settings[key] = sys.intern(settings[key].upper())
+    get = build.get_component
+    fc = get("fc")
+    esc = get("esc")
+    rx = get("receiver")
+    battery = get("battery")
+    vtx = get("vtx")
+    fc_mcu = fc.get("mcu", "") if fc is not None else ""
+    vtx_type = (vtx.get("type", "") or "").lower() if vtx is not None else ""
+
+    ctx.config = config
+    ctx.fc = fc
+    ctx.esc = esc
+    ctx.vtx = vtx
+    ctx.rx = rx
+    ctx.battery = battery
+    ctx.settings = settings
+    ctx.ints = config.int_settings
+    ctx.firmware = config.firmware
+    ctx.drone_class = drone_class
+    ctx.is_whoop = "whoop" in drone_class
+    ctx.is_7inch = is_7inch
+    ctx.is_long_range = is_7inch or "lr" in drone_class
+    ctx.is_f4 = any(mcu in fc_mcu for mcu in _F4_MCUS)
+    ctx.vtx_type = vtx_type
+    ctx.vtx_system = (vtx.get("system", "") or "").lower() if vtx is not None else ""
+    ctx.vtx_is_digital = "digital" in vtx_type
+    if esc is not None:
+        ctx.esc_firmware = esc.get("firmware", "")
+        ctx.esc_protocol = esc.get("protocol", "")
+        ctx.esc_has_current_sensor = esc.get("current_sensor", False)
+    else:
+        ctx.esc_firmware = ctx.esc_protocol = ""
+        ctx.esc_has_current_sensor = False
+    ctx.fc_mcu = fc_mcu
+    ctx.fc_osd = fc.get("osd", "") if fc is not None else ""
+    if rx is not None:
+        ctx.rx_protocol = rx.get("output_protocol", "")
+        ctx.rx_has_telemetry = rx.get("telemetry", False)
+    else:
+        ctx.rx_protocol = ""
+        ctx.rx_has_telemetry = False
+    ctx.battery_cell_count = battery.get("cell_count") if battery is not None else None
+    ctx.func_to_port = config.function_index
+    ctx.active_ports = [
+        (port.port_id, [f for f in port.functions if f != "UNUSED"])
+        for port in config.serial_ports
+    ]
+    return ctx
+
+
+def _make_ctx(config: FCConfig, build: Build) -> _Ctx:
+    return _populate(object.__new__(_Ctx), config, build)
+
 
 def _result(
     check_id: str,
@@ -57,23 +235,20 @@ def _result(
 
 # ---------------------------------------------------------------------------
 # Individual checks (fw_001 .. fw_020)
+#
+# Each check may assume the components, settings and gate declared for it in
+# ALL_CHECKS are present; validate_firmware_config skips it otherwise.
 # ---------------------------------------------------------------------------
 
 
-def _check_motor_protocol(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_motor_protocol(ctx: _Ctx) -> ValidationResult | None:
     """fw_001: Motor protocol in FC matches ESC protocol."""
-    esc = build.get_component("esc")
-    if not esc:
-        return None
-
-    fc_protocol = config.get_setting("motor_pwm_protocol", "").upper()
-    esc_protocol = esc.get("protocol", "")
-
-    if not fc_protocol or not esc_protocol:
+    fc_protocol = ctx.settings["motor_pwm_protocol"]
+    esc_protocol = ctx.esc_protocol
+    if not esc_protocol:
         return None
 
-    compatible = _MOTOR_PROTOCOL_MAP.get(fc_protocol, set())
-    if esc_protocol in compatible:
+    if (fc_protocol, esc_protocol) in _MOTOR_COMPAT_PAIRS:
         return _result("fw_001", "Motor protocol match", Severity.CRITICAL, True,
                         f"FC protocol {fc_protocol} is compatible with ESC {esc_protocol}")
 
@@ -81,34 +256,22 @@ def _check_motor_protocol(config: FCConfig, build: Build) -> ValidationResult |
                     f"FC motor protocol {fc_protocol} does not match ESC protocol {esc_protocol} — motors may not spin")
 
 
-def _check_blheli_s_dshot1200(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_blheli_s_dshot1200(ctx: _Ctx) -> ValidationResult | None:
     """fw_002: BLHeli_S ESCs cannot run DShot1200."""
-    esc = build.get_component("esc")
-    if not esc:
-        return None
+    esc_firmware = ctx.esc_firmware
+    fc_protocol = ctx.settings["motor_pwm_protocol"]
 
-    esc_firmware = esc.get("firmware", "")
-    fc_protocol = config.get_setting("motor_pwm_protocol", "").upper()
-
-    if esc_firmware != "BLHeli_S" or fc_protocol != "DSHOT1200":
+    if esc_firmware != _BLHELI_S or fc_protocol != _DSHOT1200:
         return None
 
     return _result("fw_002", "BLHeli_S DShot1200 incompatibility", Severity.CRITICAL, False,
                     f"BLHeli_S ESCs cannot run DShot1200 — use DShot600 or lower, or upgrade to BLHeli_32/AM32")
 
 
-def _check_bidir_dshot(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_bidir_dshot(ctx: _Ctx) -> ValidationResult | None:
     """fw_003: Bidirectional DShot needs BLHeli_32 or AM32."""
-    bidir = config.get_setting("dshot_bidir")
-    if bidir != "ON":
-        return None
-
-    esc = build.get_component("esc")
-    if not esc:
-        return None
-
-    esc_firmware = esc.get("firmware", "")
-    if esc_firmware in ("BLHeli_32", "AM32"):
+    esc_firmware = ctx.esc_firmware
+    if esc_firmware in _BIDIR_CAPABLE_FW:
         return _result("fw_003", "Bidirectional DShot firmware", Severity.WARNING, True,
                         f"Bidirectional DShot enabled with compatible {esc_firmware} ESC firmware")
 
@@ -116,20 +279,14 @@ def _check_bidir_dshot(config: FCConfig, build: Build) -> ValidationResult | Non
                     f"Bidirectional DShot requires BLHeli_32 or AM32, but ESC has {esc_firmware}")
 
 
-def _check_receiver_protocol(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_receiver_protocol(ctx: _Ctx) -> ValidationResult | None:
     """fw_004: serialrx_provider matches receiver output protocol."""
-    rx = build.get_component("receiver")
-    if not rx:
+    fc_serialrx = ctx.settings["serialrx_provider"]
+    rx_protocol = ctx.rx_protocol
+    if not rx_protocol:
         return None
 
-    fc_serialrx = config.get_setting("serialrx_provider", "").upper()
-    rx_protocol = rx.get("output_protocol", "")
-
-    if not fc_serialrx or not rx_protocol:
-        return None
-
-    compatible = _SERIALRX_MAP.get(fc_serialrx, set())
-    if rx_protocol in compatible:
+    if (fc_serialrx, rx_protocol) in _SERIALRX_COMPAT_PAIRS:
         return _result("fw_004", "Receiver protocol match", Severity.CRITICAL, True,
                         f"FC serial RX provider {fc_serialrx} matches receiver protocol {rx_protocol}")
 
@@ -137,16 +294,12 @@ def _check_receiver_protocol(config: FCConfig, build: Build) -> ValidationResult
                     f"FC serial RX provider {fc_serialrx} does not match receiver protocol {rx_protocol} — no RC input")
 
 
-def _check_receiver_uart(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_receiver_uart(ctx: _Ctx) -> ValidationResult | None:
     """fw_005: A serial port must have SERIAL_RX function assigned."""
-    rx = build.get_component("receiver")
-    if not rx:
+    if not ctx.config.serial_ports:
         return None
 
-    if not config.serial_ports:
-        return None
-
-    rx_port = config.get_serial_port_with_function("SERIAL_RX")
+    rx_port = ctx.func_to_port.get("SERIAL_RX")
     if rx_port:
         return _result("fw_005", "Receiver UART assigned", Severity.CRITICAL, True,
                         f"SERIAL_RX assigned to UART {rx_port.port_id}")
@@ -155,48 +308,34 @@ def _check_receiver_uart(config: FCConfig, build: Build) -> ValidationResult | N
                     "No UART has SERIAL_RX function — receiver will not work. Assign serial RX in Ports tab.")
 
 
-def _check_sbus_inversion(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_sbus_inversion(ctx: _Ctx) -> ValidationResult | None:
     """fw_006: SBUS on F4 boards needs software inversion."""
-    rx = build.get_component("receiver")
-    fc = build.get_component("fc")
-    if not rx or not fc:
+    if ctx.rx_protocol != _SBUS:
         return None
 
-    rx_protocol = rx.get("output_protocol", "")
-    if rx_protocol != "SBUS":
+    if not ctx.is_f4:
         return None
 
-    mcu = fc.get("mcu", "")
-    if "F405" not in mcu and "F411" not in mcu:
-        return None
-
-    serialrx_inverted = config.get_setting("serialrx_inverted", "OFF")
-    if serialrx_inverted == "ON":
+    serialrx_inverted = ctx.settings["serialrx_inverted"]
+    if serialrx_inverted == _ON:
         return _result("fw_006", "SBUS inversion on F4", Severity.WARNING, True,
                         "SBUS inversion enabled for F4 board")
 
     return _result("fw_006", "SBUS inversion on F4", Severity.WARNING, False,
-                    f"SBUS on {mcu} needs set serialrx_inverted = ON — F4 boards lack hardware inversion")
+                    f"SBUS on {ctx.fc_mcu} needs set serialrx_inverted = ON — F4 boards lack hardware inversion")
 
 
-def _check_vtx_uart(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_vtx_uart(ctx: _Ctx) -> ValidationResult | None:
     """fw_007: SmartAudio/Tramp VTX should have a UART for control."""
-    vtx = build.get_component("vtx")
-    if not vtx:
-        return None
-
-    vtx_system = vtx.get("system", "").lower()
-    vtx_type = vtx.get("type", "").lower()
-
     # Only applies to analog VTX with SmartAudio/Tramp
-    if "digital" in vtx_type:
+    if ctx.vtx_is_digital:
         return None
 
-    if not config.serial_ports:
+    if not ctx.config.serial_ports:
         return None
 
-    sa_port = config.get_serial_port_with_function("VTX_SMARTAUDIO")
-    tramp_port = config.get_serial_port_with_function("VTX_TRAMP")
+    sa_port = ctx.func_to_port.get("VTX_SMARTAUDIO")
+    tramp_port = ctx.func_to_port.get("VTX_TRAMP")
 
     if sa_port or tramp_port:
         port = sa_port or tramp_port
@@ -207,26 +346,18 @@ def _check_vtx_uart(config: FCConfig, build: Build) -> ValidationResult | None:
                     "No UART assigned for VTX control (SmartAudio/Tramp) — you won't be able to change VTX settings from OSD")
 
 
-def _check_dji_msp(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_dji_msp(ctx: _Ctx) -> ValidationResult | None:
     """fw_008: DJI/HDZero/Walksnail VTX needs MSP DisplayPort on a UART."""
-    vtx = build.get_component("vtx")
-    if not vtx:
-        return None
-
-    vtx_system = vtx.get("system", "").lower()
-    vtx_type = vtx.get("type", "").lower()
+    vtx = ctx.vtx
 
-    needs_msp = any(kw in vtx_system for kw in ("dji", "hdzero", "walksnail", "avatar"))
-    if not needs_msp and "digital" not in vtx_type:
-        return None
-    if not needs_msp:
+    if _DIGITAL_VTX_TOKENS.isdisjoint(_TOKEN_SPLIT_RE.split(ctx.vtx_system)):
         return None
 
-    if not config.serial_ports:
+    if not ctx.config.serial_ports:
         return None
 
-    msp_port = config.get_serial_port_with_function("VTX_MSP")
-    displayport = config.get_serial_port_with_function("MSP_DISPLAYPORT")
+    msp_port = ctx.func_to_port.get("VTX_MSP")
+    displayport = ctx.func_to_port.get("MSP_DISPLAYPORT")
 
     if msp_port or displayport:
         port = msp_port or displayport
@@ -237,35 +368,20 @@ def _check_dji_msp(config: FCConfig, build: Build) -> ValidationResult | None:
                     f"{vtx.get('system', 'Digital')} VTX needs MSP DisplayPort on a UART — no OSD will be displayed")
 
 
-def _check_vtx_type_match(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_vtx_type_match(ctx: _Ctx) -> ValidationResult | None:
     """fw_009: FC VTX table type should match VTX hardware."""
-    vtx = build.get_component("vtx")
-    if not vtx:
-        return None
-
-    vtx_type_setting = config.get_setting("vtx_table_bands")
-    if not vtx_type_setting:
-        return None
-
-    vtx_system = vtx.get("system", "").lower()
-    vtx_hw_type = vtx.get("type", "").lower()
-
-    if "digital" in vtx_hw_type and int(vtx_type_setting) > 0:
+    vtx_bands = ctx.ints["vtx_table_bands"]
+    if ctx.vtx_is_digital and vtx_bands is not None and vtx_bands > 0:
         return _result("fw_009", "VTX type match", Severity.WARNING, True,
                         "VTX table configured for digital VTX")
 
     return None
 
 
-def _check_battery_min_voltage(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_battery_min_voltage(ctx: _Ctx) -> ValidationResult | None:
     """fw_010: vbat_min_cell_voltage should be in reasonable range."""
-    min_v = config.get_setting("vbat_min_cell_voltage")
-    if not min_v:
-        return None
-
-    try:
-        min_val = int(min_v)
-    except ValueError:
+    min_val = ctx.ints["vbat_min_cell_voltage"]
+    if min_val is None:
         return None
 
     if 310 <= min_val <= 360:
@@ -280,23 +396,14 @@ def _check_battery_min_voltage(config: FCConfig, build: Build) -> ValidationResu
                     f"Min cell voltage {min_val / 100:.2f}V is unusually high — will land early unnecessarily")
 
 
-def _check_battery_cell_count(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_battery_cell_count(ctx: _Ctx) -> ValidationResult | None:
     """fw_011: FC cell detection should match battery cell_count."""
-    battery = build.get_component("battery")
-    if not battery:
-        return None
-
-    bat_cells = battery.get("cell_count")
+    bat_cells = ctx.battery_cell_count
     if not bat_cells:
         return None
 
-    max_v = config.get_setting("vbat_max_cell_voltage")
-    if not max_v:
-        return None
-
-    try:
-        max_val = int(max_v)
-    except ValueError:
+    max_val = ctx.ints["vbat_max_cell_voltage"]
+    if max_val is None:
         return None
 
     # Betaflight stores cell voltage in units of 0.01V
@@ -309,17 +416,11 @@ def _check_battery_cell_count(config: FCConfig, build: Build) -> ValidationResul
                     f"Max cell voltage {max_val / 100:.2f}V may cause incorrect cell count detection for {bat_cells}S battery")
 
 
-def _check_pid_loop_rate(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_pid_loop_rate(ctx: _Ctx) -> ValidationResult | None:
     """fw_012: PID process denominator should be adequate for DShot protocol."""
-    pid_denom = config.get_setting("pid_process_denom")
-    fc_protocol = config.get_setting("motor_pwm_protocol", "").upper()
-
-    if not pid_denom:
-        return None
-
-    try:
-        denom = int(pid_denom)
-    except ValueError:
+    denom = ctx.ints["pid_process_denom"]
+    fc_protocol = ctx.settings["motor_pwm_protocol"]
+    if denom is None:
         return None
 
     # DShot1200 needs low denominator (fast loop)
@@ -335,28 +436,23 @@ def _check_pid_loop_rate(config: FCConfig, build: Build) -> ValidationResult | N
                     f"PID loop rate (denom={denom}) adequate for {fc_protocol}")
 
 
-def _check_gyro_filter(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_gyro_filter(ctx: _Ctx) -> ValidationResult | None:
     """fw_013: Gyro LPF1 frequency reasonable for quad size."""
-    lpf1 = config.get_setting("gyro_lpf1_static_hz")
-    if not lpf1:
+    lpf1_hz = ctx.ints["gyro_lpf1_static_hz"]
+    if lpf1_hz is None:
         return None
 
-    try:
-        lpf1_hz = int(lpf1)
-    except ValueError:
-        return None
-
-    drone_class = build.drone_class
+    drone_class = ctx.drone_class
 
     if lpf1_hz == 0:
         return _result("fw_013", "Gyro filter range", Severity.INFO, True,
                         "Gyro LPF1 disabled (using dynamic filtering)")
 
-    if "whoop" in drone_class and lpf1_hz > 200:
+    if ctx.is_whoop and lpf1_hz > 200:
         return _result("fw_013", "Gyro filter range", Severity.INFO, False,
                         f"Gyro LPF1 at {lpf1_hz}Hz is high for a whoop — consider 100-150Hz")
 
-    if "7inch" in drone_class and lpf1_hz > 200:
+    if ctx.is_7inch and lpf1_hz > 200:
         return _result("fw_013", "Gyro filter range", Severity.INFO, False,
                         f"Gyro LPF1 at {lpf1_hz}Hz may be too high for 7\" — consider 100-150Hz")
 
@@ -364,23 +460,13 @@ def _check_gyro_filter(config: FCConfig, build: Build) -> ValidationResult | Non
                     f"Gyro LPF1 at {lpf1_hz}Hz is reasonable for {drone_class}")
 
 
-def _check_rpm_filtering(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_rpm_filtering(ctx: _Ctx) -> ValidationResult | None:
     """fw_014: RPM filter recommendation when bidir DShot + BLHeli_32 available."""
-    bidir = config.get_setting("dshot_bidir")
-    rpm_filter = config.get_setting("rpm_filter_harmonics")
-
-    if bidir != "ON":
+    rpm_filter = ctx.ints["rpm_filter_harmonics"]
+    if ctx.esc_firmware not in _BIDIR_CAPABLE_FW:
         return None
 
-    esc = build.get_component("esc")
-    if not esc:
-        return None
-
-    esc_firmware = esc.get("firmware", "")
-    if esc_firmware not in ("BLHeli_32", "AM32"):
-        return None
-
-    if rpm_filter and int(rpm_filter) > 0:
+    if rpm_filter is not None and rpm_filter > 0:
         return _result("fw_014", "RPM filtering", Severity.INFO, True,
                         f"RPM filtering enabled with {rpm_filter} harmonics — good for noise reduction")
 
@@ -388,18 +474,13 @@ def _check_rpm_filtering(config: FCConfig, build: Build) -> ValidationResult | N
                     "Bidirectional DShot is enabled with BLHeli_32/AM32 but RPM filtering is off — enable for better filtering")
 
 
-def _check_osd_feature(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_osd_feature(ctx: _Ctx) -> ValidationResult | None:
     """fw_015: OSD feature should be enabled if VTX supports it."""
-    vtx = build.get_component("vtx")
-    fc = build.get_component("fc")
-    if not vtx or not fc:
-        return None
-
-    fc_osd = fc.get("osd", "")
+    fc_osd = ctx.fc_osd
     if not fc_osd or fc_osd == "none":
         return None
 
-    if config.has_feature("OSD"):
+    if ctx.config.has_feature("OSD"):
         return _result("fw_015", "OSD feature", Severity.WARNING, True,
                         "OSD feature enabled")
 
@@ -407,17 +488,12 @@ def _check_osd_feature(config: FCConfig, build: Build) -> ValidationResult | Non
                     "FC has OSD chip but OSD feature is disabled — enable it to see telemetry overlay")
 
 
-def _check_telemetry_feature(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_telemetry_feature(ctx: _Ctx) -> ValidationResult | None:
     """fw_016: TELEMETRY feature should match receiver capability."""
-    rx = build.get_component("receiver")
-    if not rx:
-        return None
-
-    has_telemetry = rx.get("telemetry", False)
-    if not has_telemetry:
+    if not ctx.rx_has_telemetry:
         return None
 
-    if config.has_feature("TELEMETRY"):
+    if ctx.config.has_feature("TELEMETRY"):
         return _result("fw_016", "Telemetry feature", Severity.INFO, True,
                         "TELEMETRY feature enabled — receiver supports telemetry")
 
@@ -425,17 +501,12 @@ def _check_telemetry_feature(config: FCConfig, build: Build) -> ValidationResult
                     "Receiver supports telemetry but TELEMETRY feature is disabled — enable for battery/RSSI on TX")
 
 
-def _check_esc_sensor(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_esc_sensor(ctx: _Ctx) -> ValidationResult | None:
     """fw_017: ESC_SENSOR feature when ESC has current sensor."""
-    esc = build.get_component("esc")
-    if not esc:
+    if not ctx.esc_has_current_sensor:
         return None
 
-    has_sensor = esc.get("current_sensor", False)
-    if not has_sensor:
-        return None
-
-    esc_sensor_port = config.get_serial_port_with_function("ESC_SENSOR")
+    esc_sensor_port = ctx.func_to_port.get("ESC_SENSOR")
 
     if esc_sensor_port:
         return _result("fw_017", "ESC sensor feature", Severity.INFO, True,
@@ -445,31 +516,30 @@ def _check_esc_sensor(config: FCConfig, build: Build) -> ValidationResult | None
                     "ESC has current sensor but no UART assigned for ESC_SENSOR — per-motor telemetry unavailable")
 
 
-def _check_serial_conflicts(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_serial_conflicts(ctx: _Ctx) -> ValidationResult | None:
     """fw_018: No conflicting function assignments on same UART."""
-    if not config.serial_ports:
+    if not ctx.config.serial_ports:
         return None
 
-    # Functions that conflict with each other on the same port
     conflicts = []
-    for port in config.serial_ports:
-        active = [f for f in port.functions if f != "UNUSED"]
-        # MSP can coexist with some functions, but most pairs conflict
-        conflicting_pairs = []
-        for i, f1 in enumerate(active):
-            for f2 in active[i + 1:]:
-                # GPS + SERIAL_RX on same UART is always a conflict
-                # Two RX-type functions on same UART conflict
-                if {f1, f2} & {"SERIAL_RX", "GPS"} == {"SERIAL_RX", "GPS"}:
-                    conflicting_pairs.append((f1, f2))
-                elif f1.startswith("VTX_") and f2.startswith("VTX_"):
-                    conflicting_pairs.append((f1, f2))
-                elif f1.startswith("TELEMETRY_") and f2.startswith("TELEMETRY_"):
-                    conflicting_pairs.append((f1, f2))
-
-        if conflicting_pairs:
-            for f1, f2 in conflicting_pairs:
-                conflicts.append(f"UART{port.port_id}: {f1} + {f2}")
+    for port_id, active in ctx.active_ports:
+        cats = [_FUNC_CATEGORY.get(func, -1) for func in active]
+        seen = 0
+        repeated = 0
+        for i, cat in enumerate(cats):
+            if cat < 0:
+                cat = cats[i] = _function_category(active[i])
+            repeated |= seen & cat
+            seen |= cat
+        # Two VTX or two telemetry functions, or SERIAL_RX together with GPS
+        if not (repeated & _CAT_SHARED_PREFIX or seen & _CAT_RX_GPS == _CAT_RX_GPS):
+            continue
+
+        for i, c1 in enumerate(cats):
+            for j in range(i + 1, len(cats)):
+                pair = c1 | cats[j]
+                if pair == _CAT_RX_GPS or (c1 & _CAT_SHARED_PREFIX and c1 == cats[j]):
+                    conflicts.append(f"UART{port_id}: {active[i]} + {active[j]}")
 
     if conflicts:
         return _result("fw_018", "Serial port conflicts", Severity.CRITICAL, False,
@@ -479,47 +549,30 @@ def _check_serial_conflicts(config: FCConfig, build: Build) -> ValidationResult
                     "No conflicting serial port assignments")
 
 
-def _check_inav_nav_settings(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_inav_nav_settings(ctx: _Ctx) -> ValidationResult | None:
     """fw_019: iNav navigation settings reasonable for drone class."""
-    if config.firmware != "INAV":
-        return None
-
-    nav_max_speed = config.get_setting("nav_mc_vel_xy_max")
-    if not nav_max_speed:
+    speed = ctx.ints["nav_mc_vel_xy_max"]
+    drone_class = ctx.drone_class
+    if speed is None:
         return None
 
-    drone_class = build.drone_class
-    try:
-        speed = int(nav_max_speed)
-    except ValueError:
-        return None
-
-    if "7inch" in drone_class or "lr" in drone_class:
+    if ctx.is_long_range:
         if speed < 500:
             return _result("fw_019", "iNav nav speed settings", Severity.WARNING, False,
                             f"nav_mc_vel_xy_max={speed} is low for long range — consider 800-1200")
         return _result("fw_019", "iNav nav speed settings", Severity.WARNING, True,
                         f"Nav speed {speed} cm/s is reasonable for {drone_class}")
 
-    if "whoop" in drone_class and speed > 800:
+    if ctx.is_whoop and speed > 800:
         return _result("fw_019", "iNav nav speed settings", Severity.WARNING, False,
                         f"nav_mc_vel_xy_max={speed} is high for a whoop — consider 300-500")
 
     return None
 
 
-def _check_inav_fixed_wing(config: FCConfig, build: Build) -> ValidationResult | None:
+def _check_inav_fixed_wing(ctx: _Ctx) -> ValidationResult | None:
     """fw_020: iNav fixed-wing settings for flying_wing class."""
-    if config.firmware != "INAV":
-        return None
-
-    if build.drone_class != "flying_wing":
-        return None
-
-    platform = config.get_setting("platform_type")
-    if not platform:
-        return None
-
+    platform = ctx.settings["platform_type"]
     if platform.upper() in ("AIRPLANE", "FLYING_WING"):
         return _result("fw_020", "iNav fixed-wing platform", Severity.WARNING, True,
                         f"Platform type '{platform}' correct for flying wing")
@@ -532,45 +585,148 @@ def _check_inav_fixed_wing(config: FCConfig, build: Build) -> ValidationResult |
 # Check registry
 # ---------------------------------------------------------------------------
 
-ALL_CHECKS: list[Callable[[FCConfig, Build], ValidationResult | None]] = [
-    _check_motor_protocol,       # fw_001
-    _check_blheli_s_dshot1200,   # fw_002
-    _check_bidir_dshot,          # fw_003
-    _check_receiver_protocol,    # fw_004
-    _check_receiver_uart,        # fw_005
-    _check_sbus_inversion,       # fw_006
-    _check_vtx_uart,             # fw_007
-    _check_dji_msp,              # fw_008
-    _check_vtx_type_match,       # fw_009
-    _check_battery_min_voltage,  # fw_010
-    _check_battery_cell_count,   # fw_011
-    _check_pid_loop_rate,        # fw_012
-    _check_gyro_filter,          # fw_013
-    _check_rpm_filtering,        # fw_014
-    _check_osd_feature,          # fw_015
-    _check_telemetry_feature,    # fw_016
-    _check_esc_sensor,           # fw_017
-    _check_serial_conflicts,     # fw_018
-    _check_inav_nav_settings,    # fw_019
-    _check_inav_fixed_wing,      # fw_020
-]
+class _CheckSpec(NamedTuple):
+    """A check plus the prerequisites that must hold before it is worth calling."""
+
+    fn: Callable[[_Ctx], ValidationResult | None]
+    roles: tuple[str, ...] = ()     # _Ctx component attributes that must be present
+    settings: tuple[str, ...] = ()  # _Ctx.settings keys that must be non-empty
+    gate: Callable[[_Ctx], bool] | None = None
+
+
+def _bidir_on(ctx: _Ctx) -> bool:
+    return ctx.settings["dshot_bidir"] == _ON
+
+
+def _is_inav(ctx: _Ctx) -> bool:
+    return ctx.firmware == "INAV"
+
+
+def _is_inav_wing(ctx: _Ctx) -> bool:
+    return ctx.firmware == "INAV" and ctx.drone_class == "flying_wing"
+
+
+ALL_CHECKS: tuple[_CheckSpec, ...] = (
+    _CheckSpec(_check_motor_protocol, ("esc",), ("motor_pwm_protocol",)),         # fw_001
+    _CheckSpec(_check_blheli_s_dshot1200, ("esc",), ("motor_pwm_protocol",)),     # fw_002
+    _CheckSpec(_check_bidir_dshot, ("esc",), gate=_bidir_on),                     # fw_003
+    _CheckSpec(_check_receiver_protocol, ("rx",), ("serialrx_provider",)),        # fw_004
+    _CheckSpec(_check_receiver_uart, ("rx",)),                                    # fw_005
+    _CheckSpec(_check_sbus_inversion, ("rx", "fc")),                              # fw_006
+    _CheckSpec(_check_vtx_uart, ("vtx",)),                                        # fw_007
+    _CheckSpec(_check_dji_msp, ("vtx",)),                                         # fw_008
+    _CheckSpec(_check_vtx_type_match, ("vtx",), ("vtx_table_bands",)),            # fw_009
+    _CheckSpec(_check_battery_min_voltage, (), ("vbat_min_cell_voltage",)),       # fw_010
+    _CheckSpec(_check_battery_cell_count, ("battery",), ("vbat_max_cell_voltage",)),  # fw_011
+    _CheckSpec(_check_pid_loop_rate, (), ("pid_process_denom",)),                 # fw_012
+    _CheckSpec(_check_gyro_filter, (), ("gyro_lpf1_static_hz",)),                 # fw_013
+    _CheckSpec(_check_rpm_filtering, ("esc",), gate=_bidir_on),                   # fw_014
+    _CheckSpec(_check_osd_feature, ("vtx", "fc")),                                # fw_015
+    _CheckSpec(_check_telemetry_feature, ("rx",)),                                # fw_016
+    _CheckSpec(_check_esc_sensor, ("esc",)),                                      # fw_017
+    _CheckSpec(_check_serial_conflicts),                                          # fw_018
+    _CheckSpec(_check_inav_nav_settings, (), ("nav_mc_vel_xy_max",), _is_inav),   # fw_019
+    _CheckSpec(_check_inav_fixed_wing, (), ("platform_type",), _is_inav_wing),    # fw_020
+)
+
+
+def _compile_runner(checks: tuple[_CheckSpec, ...]) -> Callable[[_Ctx, Callable], None]:
+    """Generate one function that runs every check in *checks* in order.
+
+    Prerequisites become inline ``if`` conditions on locals, so an
+    inapplicable check costs a couple of comparisons instead of a Python-level
+    loop iteration with ``getattr``/``all`` calls. The generated function calls
+    ``append`` with each non-None result and returns early if ``append``
+    returns a truthy value (``list.append`` never does).
+    """
+    namespace: dict[str, object] = {}
+    roles = sorted({role for spec in checks for role in spec.roles})
+    lines = ["def _run_all(ctx, append):", "    settings = ctx.settings"]
+    lines += [f"    {role} = ctx.{role}" for role in roles]
+    for i, (fn, spec_roles, required, gate) in enumerate(checks):
+        namespace[f"_check{i}"] = fn
+        conditions = [f"{role} is not None" for role in spec_roles]
+        conditions += [f"settings[{key!r}]" for key in required]
+        if gate is not None:
+            namespace[f"_gate{i}"] = gate
+            conditions.append(f"_gate{i}(ctx)")
+        indent = "    "
+        if conditions:
+            lines.append(f"    if {' and '.join(conditions)}:")
+            indent = "        "
+        lines.append(f"{indent}result = _check{i}(ctx)")
+        lines.append(f"{indent}if result is not None and append(result):")
+        lines.append(f"{indent}    return")
+    exec(compile("\n".join(lines), "<firmware_validator._run_all>", "exec"), namespace)
+    return namespace["_run_all"]  # type: ignore[return-value]
+
+
+_RUN_ALL = _compile_runner(ALL_CHECKS)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def validate_firmware_config(config: FCConfig, build: Build) -> ValidationReport:
+def validate_firmware_config(
+    config: FCConfig,
+    build: Build,
+    *,
+    fail_fast: bool = False,
+    max_errors: int | None = None,
+) -> ValidationReport:
     """Run all firmware cross-validation checks.
 
     Returns a ValidationReport (same type as the component compatibility engine)
     with constraint IDs prefixed ``fw_`` to avoid collisions.
+
+    With ``fail_fast`` the run stops after the first failed CRITICAL check;
+    with ``max_errors`` it stops once that many checks have failed. The
+    report then holds only the results produced up to that point.
+
+    Raises ValueError if ``max_errors`` is given and less than 1.
     """
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("max_errors must be >= 1")
+
     report = ValidationReport(build_name=build.name)
+    ctx = _make_ctx(config, build)
+    if not fail_fast and max_errors is None:
+        _RUN_ALL(ctx, report.results.append)
+        return report
+
+    results = report.results
+    failed = 0
+
+    def append(result: ValidationResult) -> bool:
+        nonlocal failed
+        results.append(result)
+        if result.passed:
+            return False
+        failed += 1
+        if fail_fast and result.severity is Severity.CRITICAL:
+            return True
+        return max_errors is not None and failed >= max_errors
+
+    _RUN_ALL(ctx, append)
+    return report
 
-    for check_fn in ALL_CHECKS:
-        result = check_fn(config, build)
-        if result is not None:
-            report.results.append(result)
 
-    return report
+def validate_firmware_config_batch(
+    pairs: Iterable[tuple[FCConfig, Build]],
+) -> list[ValidationReport]:
+    """Run validate_firmware_config over many (config, build) pairs.
+
+    Reports are returned in input order. One context object is refilled for
+    every pair instead of allocating a new one per validation.
+    """
+    run_all = _RUN_ALL
+    populate = _populate
+    ctx = object.__new__(_Ctx)
+    reports: list[ValidationReport] = []
+    add_report = reports.append
+    for config, build in pairs:
+        report = ValidationReport(build_name=build.name)
+        run_all(populate(ctx, config, build), report.results.append)
+        add_report(report)
+    return reports
@@ -7,14 +7,15 @@ constraints, and returns the top suggestions.
 
 from __future__ import annotations
 
-import itertools
+import heapq
 import random
 from dataclasses import dataclass, field
-from typing import Any
+from operator import attrgetter
+from typing import Any, Iterator, NamedTuple
 
 from core.loader import load_components, load_constraints
-from core.models import Build, Component, Severity, ValidationResult
-from core.resolver import evaluate_constraint
+from core.models import Build, Component, Constraint, Severity
+from core.resolver import constraint_input_types, evaluate_constraint
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -37,6 +38,19 @@ class OptimizationRequest:
     priorities: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PRIORITIES))
 
 
+class _ScoredCandidate(NamedTuple):
+    """A scored candidate before its Build is assembled."""
+
+    score: float
+    position: int  # 1-based order of generation, used in the build name
+    combo: tuple[int, ...]
+    cost: float
+    breakdown: dict[str, float]
+
+
+_score_key = attrgetter("score")
+
+
 @dataclass
 class BuildSuggestion:
     """A single scored build returned by the optimizer."""
@@ -51,23 +65,31 @@ class BuildSuggestion:
 # Mapping helpers — VTX and receiver categories are not per-drone-class.
 # ---------------------------------------------------------------------------
 
-_VTX_CATEGORY_MAP: dict[str, list[str]] = {
-    "5inch": ["digital_hd", "analog"],
-    "3inch": ["digital_hd", "digital_hd_micro", "analog", "analog_micro"],
-    "whoop": ["digital_hd_micro", "analog_micro"],
+_VTX_CATEGORY_MAP: dict[str, frozenset[str]] = {
+    "5inch": frozenset({"digital_hd", "analog"}),
+    "3inch": frozenset({"digital_hd", "digital_hd_micro", "analog", "analog_micro"}),
+    "whoop": frozenset({"digital_hd_micro", "analog_micro"}),
 }
 
 # Receivers are universal; every protocol works for every class.
-_RX_CATEGORIES: list[str] = [
+_RX_CATEGORIES: frozenset[str] = frozenset({
     "elrs",
     "crossfire",
     "frsky",
     "ghost",
-]
+})
 
 # How many motors per build (quad).
 _MOTOR_COUNT = 4
 
+# Component types every candidate needs, in candidate index-tuple order.
+_REQUIRED_TYPES: tuple[str, ...] = (
+    "motor", "esc", "fc", "frame", "propeller", "battery", "vtx", "receiver",
+)
+_MOTOR, _ESC, _FRAME, _PROP = (
+    _REQUIRED_TYPES.index(t) for t in ("motor", "esc", "frame", "propeller")
+)
+
 # Reference weights by class (grams, rough midrange AUW).  Used to compute
 # relative weight scores.
 _CLASS_REFERENCE_WEIGHT_G: dict[str, float] = {
@@ -97,63 +119,42 @@ def _filter_by_category(
 ) -> dict[str, list[Component]]:
     """Return a dict with only components compatible with *drone_class*."""
 
-    vtx_cats = set(_VTX_CATEGORY_MAP.get(drone_class, []))
-    rx_cats = set(_RX_CATEGORIES)
+    vtx_cats = _VTX_CATEGORY_MAP.get(drone_class, frozenset())
+    class_cats = frozenset({drone_class})
 
     filtered: dict[str, list[Component]] = {}
     for comp_type, comp_list in components.items():
-        matching: list[Component] = []
-        for c in comp_list:
-            if comp_type == "vtx":
-                if c.category in vtx_cats:
-                    matching.append(c)
-            elif comp_type == "receiver":
-                if c.category in rx_cats:
-                    matching.append(c)
-            else:
-                if c.category == drone_class:
-                    matching.append(c)
+        # The accepted categories depend only on the type, so pick them once.
+        if comp_type == "vtx":
+            cats = vtx_cats
+        elif comp_type == "receiver":
+            cats = _RX_CATEGORIES
+        else:
+            cats = class_cats
+        matching = [c for c in comp_list if c.category in cats]
         if matching:
             filtered[comp_type] = matching
     return filtered
 
 
-def _build_total_price(
-    motor: Component,
-    esc: Component,
-    fc: Component,
-    frame: Component,
-    propeller: Component,
-    battery: Component,
-    vtx: Component,
-    receiver: Component,
-) -> float:
+def _candidate_cost(cols: _PoolColumns, combo: tuple[int, ...]) -> float:
     """Compute total price for a full build (4 motors, 1 prop set, etc.)."""
-    return (
-        motor.price_usd * _MOTOR_COUNT
-        + esc.price_usd
-        + fc.price_usd
-        + frame.price_usd
-        + propeller.price_usd  # sold as a set of 4
-        + battery.price_usd
-        + vtx.price_usd
-        + receiver.price_usd
-    )
+    cost = 0.0
+    for prices, i in zip(cols.price, combo):
+        cost += prices[i]
+    return cost
 
 
 def _make_build(
-    motor: Component,
-    esc: Component,
-    fc: Component,
-    frame: Component,
-    propeller: Component,
-    battery: Component,
-    vtx: Component,
-    receiver: Component,
+    cols: _PoolColumns,
+    combo: tuple[int, ...],
     drone_class: str,
     idx: int,
 ) -> Build:
-    """Assemble a Build dataclass from individual components."""
+    """Assemble a Build dataclass from a candidate's component indices."""
+    motor, esc, fc, frame, propeller, battery, vtx, receiver = (
+        comps[i] for comps, i in zip(cols.components, combo)
+    )
     return Build(
         name=f"Optimized {drone_class} #{idx}",
         drone_class=drone_class,
@@ -175,49 +176,41 @@ def _make_build(
 # ---------------------------------------------------------------------------
 
 
+# Numeric value of each propeller thrust_class label; unknown labels count
+# as "Medium".
+_THRUST_VALUES: dict[str, float] = {
+    "Very Low": 1.0,
+    "Low": 2.0,
+    "Low-Medium": 3.0,
+    "Medium": 4.0,
+    "Medium-High": 5.0,
+    "High": 6.0,
+    "Very High": 7.0,
+}
+
+
 def _thrust_class_value(label: str | None) -> float:
     """Convert a thrust_class label from the propeller spec into a number."""
-    mapping = {
-        "Very Low": 1.0,
-        "Low": 2.0,
-        "Low-Medium": 3.0,
-        "Medium": 4.0,
-        "Medium-High": 5.0,
-        "High": 6.0,
-        "Very High": 7.0,
-    }
-    return mapping.get(label or "", 4.0)
-
-
-def _performance_score(build: Build) -> float:
+    return _THRUST_VALUES.get(label or "", 4.0)
+
+
+def _performance_from(thrust_factor: float, auw: float) -> float:
     """Score based on estimated thrust-to-weight ratio.
 
     Higher KV, higher max-power motors, and higher-thrust props yield better
     performance.  The score is normalised to 0-100.
     """
-    motor = build.motor
-    if motor is None:
-        return 0.0
-
-    kv = motor.specs.get("kv", 0)
-    max_power_w = motor.specs.get("max_power_w", 0)
-
-    prop = build.get_component("propeller")
-    thrust_val = _thrust_class_value(prop.specs.get("thrust_class") if prop else None)
-
     # Rough relative thrust proxy:  kv * max_power * thrust_val / AUW
-    auw = build.all_up_weight_g or 1.0
-    thrust_proxy = (kv * max_power_w * thrust_val) / auw
+    thrust_proxy = thrust_factor / (auw or 1.0)
 
     # Normalise.  For a 5-inch quad this proxy is typically 5 000–20 000.
     # We clamp to 0-100.
     return min(100.0, max(0.0, thrust_proxy / 200.0))
 
 
-def _weight_score(build: Build, drone_class: str) -> float:
+def _weight_from(auw: float, drone_class: str) -> float:
     """Lighter-than-average builds score higher."""
     reference = _CLASS_REFERENCE_WEIGHT_G.get(drone_class, 500.0)
-    auw = build.all_up_weight_g
     if auw <= 0:
         return 50.0
     ratio = auw / reference
@@ -237,53 +230,206 @@ def _price_score(total_cost: float, budget: float) -> float:
     return min(100.0, max(0.0, 100.0 * (1.0 - ratio)))
 
 
-def _durability_score(build: Build) -> float:
+def _durability_from(esc_amps: float, motor_draw: float, arm_mm: float) -> float:
     """Estimates durability from ESC current headroom and frame arm thickness."""
     score = 50.0  # base
 
-    esc = build.get_component("esc")
-    motor = build.motor
-
-    if esc and motor:
-        esc_amps = esc.specs.get("continuous_current_a", 0)
-        motor_draw = motor.specs.get("max_current_a", 0)
-        if motor_draw > 0:
-            headroom = esc_amps / motor_draw
-            # headroom >= 1.5 -> +30, headroom ~1.0 -> +0, headroom < 1 -> -20
-            score += min(30.0, max(-20.0, (headroom - 1.0) * 60.0))
+    if motor_draw > 0:
+        headroom = esc_amps / motor_draw
+        # headroom >= 1.5 -> +30, headroom ~1.0 -> +0, headroom < 1 -> -20
+        score += min(30.0, max(-20.0, (headroom - 1.0) * 60.0))
 
-    frame = build.get_component("frame")
-    if frame:
-        arm_mm = frame.specs.get("arm_thickness_mm", 0)
-        # 5 mm arms -> +20, 4 mm -> +10, 3 mm -> 0, 0 (whoop) -> 0
-        score += min(20.0, max(0.0, (arm_mm - 3.0) * 10.0))
+    # 5 mm arms -> +20, 4 mm -> +10, 3 mm -> 0, 0 (whoop) -> 0
+    score += min(20.0, max(0.0, (arm_mm - 3.0) * 10.0))
 
     return min(100.0, max(0.0, score))
 
 
-def _score_build(
-    build: Build,
-    total_cost: float,
-    request: OptimizationRequest,
-) -> tuple[float, dict[str, float]]:
-    """Compute the composite 0-100 score and a breakdown dict."""
-    breakdown: dict[str, float] = {
-        "performance": _performance_score(build),
-        "weight": _weight_score(build, request.drone_class),
-        "price": _price_score(total_cost, request.budget_usd),
-        "durability": _durability_score(build),
-    }
+@dataclass
+class _PoolColumns:
+    """Struct-of-arrays view of the filtered pool, indexed like ``components``.
 
+    Candidates are tuples of indices (one per ``_REQUIRED_TYPES`` entry), so
+    cost and scores are computed from these flat lists without assembling a
+    Build; Builds are only made for the candidates that reach validation.
+    """
+
+    components: list[list[Component]]  # per required type
+    price: list[list[float]]   # per required type; motor entries cover _MOTOR_COUNT motors
+    weight: list[list[float]]  # same layout as price
+    thrust_base: list[float]   # motor kv * max_power_w
+    motor_draw: list[float]    # motor max_current_a
+    prop_thrust: list[float]   # propeller thrust class value
+    esc_amps: list[float]      # ESC continuous_current_a
+    frame_arm: list[float]     # frame arm_thickness_mm
+
+
+def _pool_columns(pool: dict[str, list[Component]]) -> _PoolColumns | None:
+    """Extract the numeric columns scoring needs; None if a required type is missing."""
+    if any(not pool.get(rt) for rt in _REQUIRED_TYPES):
+        return None
+
+    components = [pool[rt] for rt in _REQUIRED_TYPES]
+    price = [[c.price_usd for c in comps] for comps in components]
+    weight = [[c.weight_g for c in comps] for comps in components]
+    price[_MOTOR] = [p * _MOTOR_COUNT for p in price[_MOTOR]]
+    weight[_MOTOR] = [sum([w] * _MOTOR_COUNT) for w in weight[_MOTOR]]
+
+    motors = components[_MOTOR]
+    return _PoolColumns(
+        components=components,
+        price=price,
+        weight=weight,
+        thrust_base=[m.specs.get("kv", 0) * m.specs.get("max_power_w", 0) for m in motors],
+        motor_draw=[m.specs.get("max_current_a", 0) for m in motors],
+        prop_thrust=[_thrust_class_value(p.specs.get("thrust_class")) for p in components[_PROP]],
+        esc_amps=[e.specs.get("continuous_current_a", 0) for e in components[_ESC]],
+        frame_arm=[f.specs.get("arm_thickness_mm", 0) for f in components[_FRAME]],
+    )
+
+
+# Pool columns per drone class, extracted from the component DB on first use
+# and reused by later optimize() calls.
+_COLUMNS_CACHE: dict[str, _PoolColumns | None] = {}
+
+
+def _get_pool_columns(drone_class: str) -> _PoolColumns | None:
+    """Return the pool columns for *drone_class*, loading the DB from disk on first use."""
+    if drone_class not in _COLUMNS_CACHE:
+        pool = _filter_by_category(load_components(), drone_class)
+        _COLUMNS_CACHE[drone_class] = _pool_columns(pool)
+    return _COLUMNS_CACHE[drone_class]
+
+
+def clear_component_cache() -> None:
+    """Drop the cached pool columns and constraints so the next optimize() re-reads them."""
+    _COLUMNS_CACHE.clear()
+    _CONSTRAINTS_CACHE.clear()
+
+
+def _affordable_columns(cols: _PoolColumns, budget: float) -> _PoolColumns | None:
+    """Drop components that cannot appear in any build within *budget*.
+
+    A component is kept only if pairing it with the cheapest choice of every
+    other type fits the budget; that bound is summed in _candidate_cost order
+    so it equals the cost of a real candidate. The cheapest choice of each
+    type is never dropped unless everything is, so one pass reaches the
+    fixed point. Returns None when no build fits at all.
+    """
+    cheapest = [min(p) for p in cols.price]
+    keep: list[list[int]] = []
+    for t, prices in enumerate(cols.price):
+        kept = []
+        for i, price in enumerate(prices):
+            cost = 0.0
+            for u, low in enumerate(cheapest):
+                cost += price if u == t else low
+            if cost <= budget:
+                kept.append(i)
+        if not kept:
+            return None
+        keep.append(kept)
+
+    if all(len(kept) == len(prices) for kept, prices in zip(keep, cols.price)):
+        return cols
+
+    def pick(column: list, t: int) -> list:
+        return [column[i] for i in keep[t]]
+
+    return _PoolColumns(
+        components=[pick(column, t) for t, column in enumerate(cols.components)],
+        price=[pick(column, t) for t, column in enumerate(cols.price)],
+        weight=[pick(column, t) for t, column in enumerate(cols.weight)],
+        thrust_base=pick(cols.thrust_base, _MOTOR),
+        motor_draw=pick(cols.motor_draw, _MOTOR),
+        prop_thrust=pick(cols.prop_thrust, _PROP),
+        esc_amps=pick(cols.esc_amps, _ESC),
+        frame_arm=pick(cols.frame_arm, _FRAME),
+    )
+
+
+def _candidate_weight(cols: _PoolColumns, combo: tuple[int, ...]) -> float:
+    """All-up weight in the same summation order as Build.all_up_weight_g."""
+    auw = 0.0
+    for weights, i in zip(cols.weight, combo):
+        auw += weights[i]
+    return auw
+
+
+def _score_candidates(
+    cols: _PoolColumns,
+    candidates: list[tuple[tuple[int, ...], float]],
+    request: OptimizationRequest,
+    top_n: int,
+) -> list[_ScoredCandidate]:
+    """Score candidates with a composite 0-100 score and a breakdown dict.
+
+    One loop over the index tuples: the normalised priority weights and the
+    pool columns are bound once per call, and the durability sub-score,
+    which depends only on the ESC, motor and frame, is memoized so
+    candidates sharing those parts reuse it.
+
+    Candidates that provably cannot reach the *top_n* highest scores are
+    left out: once *top_n* scores are known, a candidate whose price score
+    plus full marks elsewhere does not beat the lowest of them is skipped
+    (a later candidate also loses ties). The top *top_n* of the result are
+    the same as when scoring everything.
+    """
     # Normalise priority weights so they sum to 1.
     weights = request.priorities
     total_w = sum(weights.values()) or 1.0
-    composite = sum(
-        breakdown[k] * (weights.get(k, 0.0) / total_w)
-        for k in breakdown
-    )
+    w_perf = weights.get("performance", 0.0) / total_w
+    w_weight = weights.get("weight", 0.0) / total_w
+    w_price = weights.get("price", 0.0) / total_w
+    w_dur = weights.get("durability", 0.0) / total_w
+
+    drone_class = request.drone_class
+    budget = request.budget_usd
+    thrust_base, prop_thrust = cols.thrust_base, cols.prop_thrust
+    esc_amps, motor_draw, frame_arm = cols.esc_amps, cols.motor_draw, cols.frame_arm
+
+    # The bound is only valid when no weight is negative.
+    can_prune = min(w_perf, w_weight, w_price, w_dur) >= 0.0
+    best: list[float] = []  # min-heap of the top_n scores so far
+
+    memo: dict[tuple[int, int, int], float] = {}
+    scored: list[_ScoredCandidate] = []
+    for position, (combo, cost) in enumerate(candidates, 1):
+        price = _price_score(cost, budget)
+        # Summed in the same order as the composite, so rounding cannot
+        # push the bound below the real score.
+        if can_prune and len(best) >= top_n and (
+            100.0 * w_perf + 100.0 * w_weight + price * w_price + 100.0 * w_dur <= best[0]
+        ):
+            continue
+
+        motor_i, esc_i, frame_i = combo[_MOTOR], combo[_ESC], combo[_FRAME]
+        auw = _candidate_weight(cols, combo)
+
+        key = (esc_i, motor_i, frame_i)
+        durability = memo.get(key)
+        if durability is None:
+            durability = memo[key] = _durability_from(
+                esc_amps[esc_i], motor_draw[motor_i], frame_arm[frame_i],
+            )
 
-    composite = min(100.0, max(0.0, composite))
-    return composite, breakdown
+        performance = _performance_from(thrust_base[motor_i] * prop_thrust[combo[_PROP]], auw)
+        weight = _weight_from(auw, drone_class)
+
+        composite = performance * w_perf + weight * w_weight + price * w_price + durability * w_dur
+        composite = min(100.0, max(0.0, composite))
+        breakdown = {
+            "performance": performance,
+            "weight": weight,
+            "price": price,
+            "durability": durability,
+        }
+        scored.append(_ScoredCandidate(composite, position, combo, cost, breakdown))
+        if len(best) < top_n:
+            heapq.heappush(best, composite)
+        elif composite > best[0]:
+            heapq.heapreplace(best, composite)
+    return scored
 
 
 # ---------------------------------------------------------------------------
@@ -298,20 +444,73 @@ _SUB250_CONSTRAINT_IDS: set[str] = {"wt_001", "wt_002"}
 _SUB250_CLASSES: set[str] = {"whoop"}
 
 
-def _has_critical_failure(build: Build) -> bool:
-    """Return True if any constraint with severity=CRITICAL fails.
+# Relative cost of evaluating a check, by operator: "range" resolves a third
+# field and "expression" goes through the expression evaluator.  Unlisted
+# operators compare two resolved fields.
+_OPERATOR_COST: dict[str, int] = {"range": 1, "expression": 2}
+
+
+def _check_cost(constraint: Constraint) -> int:
+    return _OPERATOR_COST.get(constraint.check.get("operator", "expression"), 0)
 
-    Constraints whose IDs are in ``_SUB250_CONSTRAINT_IDS`` are only
-    evaluated for drone classes listed in ``_SUB250_CLASSES``.
+
+# Critical constraints per drone class, parsed from YAML on first use and
+# reused by later optimize() calls (cleared with the pool columns).
+_CONSTRAINTS_CACHE: dict[str, list[Constraint]] = {}
+
+
+def _critical_constraints(drone_class: str) -> list[Constraint]:
+    """Return the CRITICAL constraints that apply to *drone_class*, cheapest first.
+
+    A result carries its constraint's severity, so only CRITICAL constraints
+    can produce a critical failure. Constraints whose IDs are in
+    ``_SUB250_CONSTRAINT_IDS`` are only kept for drone classes listed in
+    ``_SUB250_CLASSES``. The list is ordered by _check_cost (stable within
+    a cost) so _has_critical_failure usually stops on a cheap check.
     """
-    constraints = load_constraints()
-    drone_class = build.drone_class
-    for constraint in constraints:
-        # Skip sub-250g constraints for larger builds.
-        if constraint.id in _SUB250_CONSTRAINT_IDS and drone_class not in _SUB250_CLASSES:
-            continue
-        result: ValidationResult = evaluate_constraint(constraint, build)
-        if not result.passed and result.severity == Severity.CRITICAL:
+    constraints = _CONSTRAINTS_CACHE.get(drone_class)
+    if constraints is None:
+        constraints = _CONSTRAINTS_CACHE[drone_class] = _load_critical_constraints(drone_class)
+    return constraints
+
+
+def _load_critical_constraints(drone_class: str) -> list[Constraint]:
+    sub250 = drone_class in _SUB250_CLASSES
+    constraints = [
+        constraint
+        for constraint in load_constraints()
+        if constraint.severity == Severity.CRITICAL
+        and (sub250 or constraint.id not in _SUB250_CONSTRAINT_IDS)
+    ]
+    constraints.sort(key=_check_cost)
+    return constraints
+
+
+def _has_critical_failure(
+    build: Build,
+    constraints: list[tuple[Constraint, tuple[str, ...] | None]],
+    memo: dict[tuple, bool],
+) -> bool:
+    """Return True if any of *constraints* (from _critical_constraints) fails.
+
+    *constraints* pairs each constraint with its constraint_input_types().
+    *memo* caches pass/fail by constraint and the ids of those components,
+    so candidates sharing e.g. the same motor and ESC within one optimize()
+    call reuse the result; checks on build-level fields are always evaluated.
+    """
+    get = build.get_component
+    for constraint, input_types in constraints:
+        if input_types is None:
+            passed = evaluate_constraint(constraint, build).passed
+        else:
+            key = (constraint.id, *[
+                comp.id if comp is not None else None
+                for comp in map(get, input_types)
+            ])
+            passed = memo.get(key)
+            if passed is None:
+                passed = memo[key] = evaluate_constraint(constraint, build).passed
+        if not passed:
             return True
     return False
 
@@ -321,75 +520,111 @@ def _has_critical_failure(build: Build) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def _generate_candidates(
-    pool: dict[str, list[Component]],
-    drone_class: str,
+def _affordable_product(
+    cols: _PoolColumns,
     budget: float,
-) -> list[tuple[Build, float]]:
-    """Generate candidate builds via greedy + random sampling.
+) -> Iterator[tuple[tuple[int, ...], float]]:
+    """Yield every (combo, cost) within *budget*, in itertools.product order.
 
-    Returns a list of (Build, total_cost) tuples.
+    Walks the product depth-first and drops a whole subtree as soon as the
+    partial cost plus the cheapest choice for every remaining type exceeds
+    the budget. Costs are accumulated left to right, exactly as in
+    _candidate_cost, so the bound never rejects an affordable combination.
     """
-    # Required component types.
-    required = ["motor", "esc", "fc", "frame", "propeller", "battery", "vtx", "receiver"]
+    prices = cols.price
+    depth = len(prices)
+    cheapest = [min(p) for p in prices]
+
+    def walk(t: int, prefix: tuple[int, ...], cost: float) -> Iterator[tuple[tuple[int, ...], float]]:
+        if t == depth:
+            yield prefix, cost
+            return
+        for i, price in enumerate(prices[t]):
+            partial = cost + price
+            bound = partial
+            for u in range(t + 1, depth):
+                bound += cheapest[u]
+            if bound > budget:
+                continue
+            yield from walk(t + 1, prefix + (i,), partial)
 
-    # If any required type is missing, we cannot build.
-    for rt in required:
-        if rt not in pool or not pool[rt]:
-            return []
+    return walk(0, (), 0.0)
 
-    lists = [pool[rt] for rt in required]
+
+def _stratified_indices(size: int, count: int) -> list[int]:
+    """Return *count* indices into a pool of *size* in random order.
+
+    Each index appears ``count // size`` or one more times (Latin-hypercube
+    style), so small pools are covered evenly instead of by chance.
+    """
+    reps, extra = divmod(count, size)
+    column = list(range(size)) * reps + random.sample(range(size), extra)
+    random.shuffle(column)
+    return column
+
+
+def _generate_candidates(
+    cols: _PoolColumns,
+    budget: float,
+) -> list[tuple[tuple[int, ...], float]]:
+    """Generate candidate builds via greedy + random sampling.
+
+    Returns a list of (component indices, total_cost) tuples; the indices
+    follow ``_REQUIRED_TYPES`` and point into ``cols.components``.
+    """
+    sizes = [len(comps) for comps in cols.components]
 
     # Full cartesian product size.
     product_size = 1
-    for lst in lists:
-        product_size *= len(lst)
+    for size in sizes:
+        product_size *= size
         if product_size > _MAX_CANDIDATES * 10:
             break
 
-    candidates: list[tuple[Build, float]] = []
-    seen_keys: set[str] = set()
-    idx = 0
+    candidates: list[tuple[tuple[int, ...], float]] = []
 
     if product_size <= _MAX_CANDIDATES:
         # Exhaustive for small product spaces.
-        for combo in itertools.product(*lists):
-            motor, esc, fc, frame, propeller, battery, vtx, receiver = combo
-            cost = _build_total_price(motor, esc, fc, frame, propeller, battery, vtx, receiver)
-            if cost > budget:
-                continue
-            idx += 1
-            build = _make_build(motor, esc, fc, frame, propeller, battery, vtx, receiver, drone_class, idx)
-            candidates.append((build, cost))
+        candidates.extend(_affordable_product(cols, budget))
     else:
         # Greedy: cheapest of each type first.
-        sorted_lists = [sorted(lst, key=lambda c: c.price_usd) for lst in lists]
-        greedy = tuple(sl[0] for sl in sorted_lists)
-        cost = _build_total_price(*greedy)
+        greedy = tuple(
+            min(range(len(comps)), key=lambda i: comps[i].price_usd)
+            for comps in cols.components
+        )
+        # Each combination packs into one int (mixed radix over the pool sizes)
+        # so duplicates are detected with an int set.
+        strides = [1] * len(sizes)
+        for t in range(len(sizes) - 2, -1, -1):
+            strides[t] = strides[t + 1] * sizes[t + 1]
+        seen_codes: set[int] = set()
+
+        cost = _candidate_cost(cols, greedy)
         if cost <= budget:
-            idx += 1
-            build = _make_build(*greedy, drone_class, idx)
-            key = "-".join(c.id for c in greedy)
-            seen_keys.add(key)
-            candidates.append((build, cost))
-
-        # Random sampling.
-        attempts = 0
+            seen_codes.add(sum(i * stride for i, stride in zip(greedy, strides)))
+            candidates.append((greedy, cost))
+
+        # Stratified random sampling: every pool is drawn evenly across the
+        # attempts, then rows are deduplicated by packed code.
         max_attempts = _MAX_CANDIDATES * 5
-        while len(candidates) < _MAX_CANDIDATES and attempts < max_attempts:
-            attempts += 1
-            combo = tuple(random.choice(lst) for lst in lists)
-            key = "-".join(c.id for c in combo)
-            if key in seen_keys:
+        columns = [_stratified_indices(size, max_attempts) for size in sizes]
+        # The eight required types are unpacked so the per-attempt code and
+        # cost are plain expressions (same left-to-right sums as
+        # _candidate_cost) instead of generator-driven calls.
+        p0, p1, p2, p3, p4, p5, p6, p7 = cols.price
+        s0, s1, s2, s3, s4, s5, s6, _ = strides
+        for combo in zip(*columns):
+            if len(candidates) >= _MAX_CANDIDATES:
+                break
+            i0, i1, i2, i3, i4, i5, i6, i7 = combo
+            code = i0 * s0 + i1 * s1 + i2 * s2 + i3 * s3 + i4 * s4 + i5 * s5 + i6 * s6 + i7
+            if code in seen_codes:
                 continue
-            seen_keys.add(key)
-            motor, esc, fc, frame, propeller, battery, vtx, receiver = combo
-            cost = _build_total_price(motor, esc, fc, frame, propeller, battery, vtx, receiver)
+            seen_codes.add(code)
+            cost = p0[i0] + p1[i1] + p2[i2] + p3[i3] + p4[i4] + p5[i5] + p6[i6] + p7[i7]
             if cost > budget:
                 continue
-            idx += 1
-            build = _make_build(motor, esc, fc, frame, propeller, battery, vtx, receiver, drone_class, idx)
-            candidates.append((build, cost))
+            candidates.append((combo, cost))
 
     return candidates
 
@@ -415,38 +650,44 @@ def optimize(request: OptimizationRequest) -> list[BuildSuggestion]:
     if request.drone_class in _NON_QUAD_CLASSES:
         return []
 
-    all_components = load_components()
-    pool = _filter_by_category(all_components, request.drone_class)
+    cols = _get_pool_columns(request.drone_class)
+    if cols is None:
+        return []
+    cols = _affordable_columns(cols, request.budget_usd)
+    if cols is None:
+        return []
 
-    candidates = _generate_candidates(pool, request.drone_class, request.budget_usd)
+    candidates = _generate_candidates(cols, request.budget_usd)
 
     if not candidates:
         return []
 
-    # Score all candidates.
-    scored: list[BuildSuggestion] = []
-    for build, cost in candidates:
-        composite, breakdown = _score_build(build, cost, request)
-        scored.append(
-            BuildSuggestion(
-                build=build,
-                total_cost=cost,
-                score=composite,
-                score_breakdown=breakdown,
-            )
-        )
+    # Score all candidates from the pool columns; no Builds yet.
+    scored = _score_candidates(cols, candidates, request, _PRE_CONSTRAINT_TOP_N)
 
-    # Sort by score descending.
-    scored.sort(key=lambda s: s.score, reverse=True)
+    # Take top N by score, descending, for constraint validation (expensive).
+    # nlargest keeps generation order among equal scores, like a stable sort.
+    top_candidates = heapq.nlargest(_PRE_CONSTRAINT_TOP_N, scored, key=_score_key)
 
-    # Take top N for constraint validation (expensive).
-    top_candidates = scored[:_PRE_CONSTRAINT_TOP_N]
-
-    # Filter out builds with critical constraint failures.
+    # Filter out builds with critical constraint failures.  Builds are only
+    # assembled here, for the few candidates that reach validation.
+    constraints = [
+        (constraint, constraint_input_types(constraint))
+        for constraint in _critical_constraints(request.drone_class)
+    ]
+    constraint_memo: dict[tuple, bool] = {}
     validated: list[BuildSuggestion] = []
-    for suggestion in top_candidates:
-        if not _has_critical_failure(suggestion.build):
-            validated.append(suggestion)
+    for candidate in top_candidates:
+        build = _make_build(cols, candidate.combo, request.drone_class, candidate.position)
+        if not _has_critical_failure(build, constraints, constraint_memo):
+            validated.append(
+                BuildSuggestion(
+                    build=build,
+                    total_cost=candidate.cost,
+                    score=candidate.score,
+                    score_breakdown=candidate.breakdown,
+                )
+            )
         if len(validated) >= _RESULT_TOP_N:
             break
 
@@ -11,6 +11,11 @@ from dataclasses import dataclass
 
 from core.models import Build
 
+# Fixed-wing and VTOL perf calcs are not yet supported.
+_NON_QUAD_CLASSES: frozenset[str] = frozenset({"flying_wing", "vtol"})
+
+# Inches to metres, for prop diameter and pitch.
+_IN_TO_M = 0.0254
 
 # ---------------------------------------------------------------------------
 # Estimation helpers
@@ -130,9 +135,26 @@ def calculate_performance(build: Build) -> PerformanceReport:
     ValueError
         If critical components (motor, battery) are missing from the build.
     """
+    return _calculate(build, {})
+
 
+def calculate_performance_batch(builds: list[Build]) -> list[PerformanceReport]:
+    """Compute performance metrics for several builds, in order.
+
+    Builds that share a motor and propeller (e.g. optimizer candidates)
+    reuse the per-motor thrust estimate. Raises ValueError like
+    calculate_performance() for the first unsupported build.
+    """
+    thrust_memo: dict[tuple[int, int], float] = {}
+    return [_calculate(build, thrust_memo) for build in builds]
+
+
+def _calculate(
+    build: Build,
+    thrust_memo: dict[tuple[int, int], float],
+) -> PerformanceReport:
+    """calculate_performance() body; *thrust_memo* caches thrust per (motor, prop) pair."""
     # Guard: fixed-wing and VTOL perf calcs are not yet supported
-    _NON_QUAD_CLASSES = {"flying_wing", "vtol"}
     if build.drone_class in _NON_QUAD_CLASSES:
         raise ValueError(
             f"Performance calculation for '{build.drone_class}' builds is not yet supported. "
@@ -152,14 +174,15 @@ def calculate_performance(build: Build) -> PerformanceReport:
     motor_count = build.motor_count
 
     # --- Motor specs ---
-    kv = float(motor.specs.get("kv", 0))
-    max_current_per_motor = float(motor.specs.get("max_current_a", 0))
+    motor_specs = motor.specs
+    kv = float(motor_specs.get("kv", 0))
+    max_current_per_motor = float(motor_specs.get("max_current_a", 0))
 
     # --- Battery specs ---
-    capacity_mah = float(battery.specs.get("capacity_mah", 0))
-    cell_count = int(battery.specs.get("cell_count", 0))
-    voltage_nominal = float(battery.specs.get("voltage_nominal_v", cell_count * 3.7))
-    voltage_max = float(battery.specs.get("voltage_max_v", cell_count * 4.2))
+    battery_specs = battery.specs
+    capacity_mah = float(battery_specs.get("capacity_mah", 0))
+    cell_count = int(battery_specs.get("cell_count", 0))
+    voltage_nominal = float(battery_specs.get("voltage_nominal_v", cell_count * 3.7))
 
     # --- Propeller specs (optional but strongly recommended) ---
     prop_specs: dict = propeller.specs if propeller else {}
@@ -167,7 +190,10 @@ def calculate_performance(build: Build) -> PerformanceReport:
     pitch_inches = float(prop_specs.get("pitch_inches", 4.0))
 
     # --- Thrust ---
-    max_thrust_per_motor = _estimate_max_thrust_g(motor.specs, prop_specs)
+    thrust_key = (id(motor), id(propeller))
+    max_thrust_per_motor = thrust_memo.get(thrust_key)
+    if max_thrust_per_motor is None:
+        max_thrust_per_motor = thrust_memo[thrust_key] = _estimate_max_thrust_g(motor_specs, prop_specs)
     total_thrust_g = max_thrust_per_motor * motor_count
 
     # --- Weight ---
@@ -180,16 +206,13 @@ def calculate_performance(build: Build) -> PerformanceReport:
 
     # --- Hover throttle ---
     # Thrust scales roughly with throttle^2 for brushless motors,
-    # so hover_throttle = sqrt(1 / TWR)
-    if twr > 0:
-        hover_throttle = math.sqrt(1.0 / twr)
-    else:
-        hover_throttle = 1.0
-    hover_throttle_pct = hover_throttle * 100.0
+    # so hover_throttle = sqrt(1 / TWR); current uses throttle^2 = 1 / TWR.
+    inv_twr = 1.0 / twr if twr > 0 else 1.0
+    hover_throttle_pct = math.sqrt(inv_twr) * 100.0
 
     # --- Current & Power ---
     max_current_draw_a = max_current_per_motor * motor_count
-    hover_current_a = max_current_draw_a * (hover_throttle ** 2)
+    hover_current_a = max_current_draw_a * inv_twr
     hover_power_w = hover_current_a * voltage_nominal
     max_power_w = max_current_draw_a * voltage_nominal
 
@@ -207,12 +230,12 @@ def calculate_performance(build: Build) -> PerformanceReport:
 
     # --- RPM & tip speed ---
     max_rpm = kv * cell_count * 4.2
-    prop_diameter_m = diameter_inches * 0.0254
+    prop_diameter_m = diameter_inches * _IN_TO_M
     prop_tip_speed_ms = max_rpm * prop_diameter_m * math.pi / 60.0
 
     # --- Max speed estimate ---
     # Pitch speed derated by ~50% for real-world efficiency
-    pitch_m = pitch_inches * 0.0254
+    pitch_m = pitch_inches * _IN_TO_M
     max_speed_estimate_kmh = pitch_m * max_rpm * 60.0 / 1000.0 * 0.5
 
     # --- Efficiency at hover ---
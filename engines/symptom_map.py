@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from core.models import Discrepancy, Severity, ValidationResult
+from functools import lru_cache, reduce
+from itertools import chain
+from operator import itemgetter, or_
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple
+
+from core.models import Discrepancy, ValidationResult
 
 
 # ---------------------------------------------------------------------------
 # Symptom labels (ID → human-readable description)
 # ---------------------------------------------------------------------------
 
-SYMPTOMS: dict[str, str] = {
+SYMPTOMS: Mapping[str, str] = MappingProxyType({
     "cant_arm": "Will not arm",
     "motors_wont_spin": "Motors won't spin / ESC not initializing",
     "flips_on_takeoff": "Flips on takeoff",
@@ -24,14 +30,14 @@ SYMPTOMS: dict[str, str] = {
     "vtx_not_changing": "VTX not changing channels/power",
     "compass_drift": "Compass / heading drift",
     "altitude_hold_issues": "Altitude hold not working",
-}
+})
 
 
 # ---------------------------------------------------------------------------
 # Symptom descriptions — detailed human-readable explanation for each symptom
 # ---------------------------------------------------------------------------
 
-SYMPTOM_DESCRIPTIONS: dict[str, str] = {
+SYMPTOM_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
     "cant_arm": (
         "Motors do not arm when the arm switch is activated. The drone stays "
         "disarmed with no motor response. Common causes include receiver issues, "
@@ -102,7 +108,7 @@ SYMPTOM_DESCRIPTIONS: dict[str, str] = {
         "or is unavailable. Caused by barometer/GPS configuration issues "
         "or incorrect navigation settings for the drone class."
     ),
-}
+})
 
 
 # ---------------------------------------------------------------------------
@@ -189,6 +195,88 @@ _SYMPTOM_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+def _keyword_weight(keyword: str) -> float:
+    """Base score 1.0 per keyword hit, plus 0.5 per extra word in a phrase."""
+    return 1.0 + keyword.count(" ") * 0.5
+
+
+def _build_keyword_index(
+    symptom_keywords: dict[str, list[str]],
+) -> dict[str, tuple[float, tuple[str, ...]]]:
+    """Map each distinct keyword to its hit weight and the symptom keys that list it."""
+    index: dict[str, tuple[float, tuple[str, ...]]] = {}
+    for symptom_key, keywords in symptom_keywords.items():
+        for keyword in keywords:
+            _, symptom_keys = index.get(keyword, (0.0, ()))
+            index[keyword] = (_keyword_weight(keyword), symptom_keys + (symptom_key,))
+    return index
+
+
+# Built once at import so match_symptom tests each keyword a single time and
+# only normalizes the symptoms that were actually hit.
+_KEYWORD_SYMPTOMS: dict[str, tuple[float, tuple[str, ...]]] = _build_keyword_index(_SYMPTOM_KEYWORDS)
+
+# Keywords grouped by their first _GRAM characters. A keyword can only occur
+# in the text if its leading gram does, so match_symptom collects the text's
+# grams once and substring-tests just the keywords filed under them.
+_GRAM = 3
+
+
+def _build_gram_index(keywords: Iterable[str]) -> dict[str, tuple[str, ...]]:
+    """Group keywords by leading gram; shorter keywords are filed under ""."""
+    index: dict[str, tuple[str, ...]] = {}
+    for keyword in keywords:
+        gram = keyword[:_GRAM] if len(keyword) >= _GRAM else ""
+        index[gram] = index.get(gram, ()) + (keyword,)
+    return index
+
+
+_GRAM_KEYWORDS: dict[str, tuple[str, ...]] = _build_gram_index(_KEYWORD_SYMPTOMS)
+
+# Normalization factor per symptom: each weighted hit counts 1 / keyword count.
+_BASE_PER_HIT: dict[str, float] = {
+    symptom_key: 1.0 / max(len(keywords), 1)
+    for symptom_key, keywords in _SYMPTOM_KEYWORDS.items()
+}
+
+# Confidence below or at this is not reported.
+_MIN_CONFIDENCE = 0.2
+
+
+def _confidence(hits: float, base_per_hit: float) -> float:
+    """Map weighted keyword hits to a 0-1 confidence."""
+    # Normalize: a single keyword hit should give ~0.25,
+    # 2 hits ~0.45, 3+ hits ~0.6+, many hits approach 1.0
+    # Use diminishing returns: 1 - (1 - base)^hits
+    raw_score = min(1.0, hits * base_per_hit)
+
+    # Scale up so a single hit is around 0.25, 2 hits around 0.45
+    return min(1.0, raw_score * 3.5)
+
+
+def _confidence_table(base_per_hit: float) -> tuple[float, ...]:
+    """Reported confidence for weighted hits 0, 0.5, 1.0, ... up to full confidence.
+
+    Keyword weights are multiples of 0.5, so every possible hit total has an
+    entry (totals past the end are saturated). Entries hold the rounded
+    confidence, or 0.0 where it does not exceed _MIN_CONFIDENCE.
+    """
+    table: list[float] = []
+    half_hits = 0
+    while True:
+        confidence = _confidence(half_hits * 0.5, base_per_hit)
+        table.append(round(confidence, 2) if confidence > _MIN_CONFIDENCE else 0.0)
+        if confidence >= 1.0:
+            return tuple(table)
+        half_hits += 1
+
+
+_CONFIDENCE_TABLES: dict[str, tuple[float, ...]] = {
+    symptom_key: _confidence_table(base_per_hit)
+    for symptom_key, base_per_hit in _BASE_PER_HIT.items()
+}
+
+
 def match_symptom(user_text: str) -> list[tuple[str, float]]:
     """Match free-text user input to ranked symptom keys with confidence scores.
 
@@ -204,58 +292,72 @@ def match_symptom(user_text: str) -> list[tuple[str, float]]:
     text_lower = user_text.lower().strip()
     if not text_lower:
         return []
+    return list(_match_normalized(text_lower))
 
-    scores: list[tuple[str, float]] = []
 
-    for symptom_key, keywords in _SYMPTOM_KEYWORDS.items():
-        weighted_hits = 0.0
-        num_keywords = len(keywords)
+@lru_cache(maxsize=1024)
+def _match_normalized(text_lower: str) -> tuple[tuple[str, float], ...]:
+    """match_symptom() on lower-cased, stripped text; cached, so results are immutable."""
+    # Only keywords whose leading gram appears in the text can match
+    grams = {text_lower[i:i + _GRAM] for i in range(len(text_lower) - _GRAM + 1)}
+    grams.add("")
 
-        for keyword in keywords:
+    # Accumulate hits per symptom for the keywords that survive the gram filter
+    weighted_hits: dict[str, float] = {}
+    for gram in grams.intersection(_GRAM_KEYWORDS):
+        for keyword in _GRAM_KEYWORDS[gram]:
             if keyword in text_lower:
-                # Base score per keyword hit, plus bonus for multi-word phrases
-                word_count = len(keyword.split())
-                weighted_hits += 1.0 + (word_count - 1) * 0.5
-
-        if weighted_hits == 0:
-            continue
-
-        # Normalize: a single keyword hit should give ~0.25,
-        # 2 hits ~0.45, 3+ hits ~0.6+, many hits approach 1.0
-        # Use diminishing returns: 1 - (1 - base)^hits
-        base_per_hit = 1.0 / max(num_keywords, 1)
-        raw_score = min(1.0, weighted_hits * base_per_hit)
+                weight, symptom_keys = _KEYWORD_SYMPTOMS[keyword]
+                for symptom_key in symptom_keys:
+                    weighted_hits[symptom_key] = weighted_hits.get(symptom_key, 0.0) + weight
 
-        # Scale up so a single hit is around 0.25, 2 hits around 0.45
-        confidence = min(1.0, raw_score * 3.5)
+    scores: list[tuple[str, float]] = []
 
-        if confidence > 0.2:
-            scores.append((symptom_key, round(confidence, 2)))
+    for symptom_key, hits in weighted_hits.items():
+        # Normalization is a table lookup on the hit total, in half steps
+        table = _CONFIDENCE_TABLES[symptom_key]
+        confidence = table[min(int(hits * 2), len(table) - 1)]
+        if confidence:
+            scores.append((symptom_key, confidence))
 
     # Sort by confidence descending, then alphabetically for ties
     scores.sort(key=lambda x: (-x[1], x[0]))
-    return scores
+    return tuple(scores)
 
 
 # ---------------------------------------------------------------------------
 # Symptom → relevant check IDs (disc_*, fw_*, YAML constraint IDs)
 # ---------------------------------------------------------------------------
 
-SYMPTOM_CHECKS: dict[str, list[str]] = {
-    "cant_arm": ["disc_002", "fw_005", "fw_018"],
-    "motors_wont_spin": ["disc_004", "disc_005", "fw_001", "fw_002", "elec_001", "elec_002"],
-    "flips_on_takeoff": ["disc_010", "fw_001", "disc_004"],
-    "no_video": ["disc_003", "fw_007", "fw_008", "fw_015"],
-    "no_receiver": ["disc_002", "fw_004", "fw_005", "fw_006"],
-    "low_range": ["disc_002", "fw_004", "fw_005", "fw_016"],
-    "gps_not_working": ["disc_008", "fw_018"],
-    "rth_not_working": ["disc_008", "fw_018", "fw_019"],
-    "bad_vibrations": ["fw_012", "fw_013", "fw_014"],
-    "short_flight_time": ["disc_006", "fw_010", "fw_011", "elec_005"],
-    "failsafe_issues": ["disc_002", "fw_004", "fw_005", "fw_016"],
-    "vtx_not_changing": ["disc_003", "fw_007", "fw_008", "fw_009"],
-    "compass_drift": ["disc_008", "fw_018"],
-    "altitude_hold_issues": ["disc_008", "fw_018", "fw_019"],
+SYMPTOM_CHECKS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "cant_arm": ("disc_002", "fw_005", "fw_018"),
+    "motors_wont_spin": ("disc_004", "disc_005", "fw_001", "fw_002", "elec_001", "elec_002"),
+    "flips_on_takeoff": ("disc_010", "fw_001", "disc_004"),
+    "no_video": ("disc_003", "fw_007", "fw_008", "fw_015"),
+    "no_receiver": ("disc_002", "fw_004", "fw_005", "fw_006"),
+    "low_range": ("disc_002", "fw_004", "fw_005", "fw_016"),
+    "gps_not_working": ("disc_008", "fw_018"),
+    "rth_not_working": ("disc_008", "fw_018", "fw_019"),
+    "bad_vibrations": ("fw_012", "fw_013", "fw_014"),
+    "short_flight_time": ("disc_006", "fw_010", "fw_011", "elec_005"),
+    "failsafe_issues": ("disc_002", "fw_004", "fw_005", "fw_016"),
+    "vtx_not_changing": ("disc_003", "fw_007", "fw_008", "fw_009"),
+    "compass_drift": ("disc_008", "fw_018"),
+    "altitude_hold_issues": ("disc_008", "fw_018", "fw_019"),
+})
+
+
+# Each check ID named in SYMPTOM_CHECKS gets one bit; a symptom's mask ORs
+# the bits of its checks, so relevance in prioritize_results is an int AND.
+_CHECK_BIT: dict[str, int] = {
+    check_id: 1 << bit
+    for bit, check_id in enumerate(
+        dict.fromkeys(check_id for check_ids in SYMPTOM_CHECKS.values() for check_id in check_ids)
+    )
+}
+_SYMPTOM_MASK: dict[str, int] = {
+    symptom: reduce(or_, (_CHECK_BIT[check_id] for check_id in check_ids), 0)
+    for symptom, check_ids in SYMPTOM_CHECKS.items()
 }
 
 
@@ -263,7 +365,7 @@ SYMPTOM_CHECKS: dict[str, list[str]] = {
 # Fix suggestions per check ID
 # ---------------------------------------------------------------------------
 
-FIX_SUGGESTIONS: dict[str, str] = {
+FIX_SUGGESTIONS: Mapping[str, str] = MappingProxyType({
     # Firmware validator checks
     "fw_001": "In Betaflight Configurator -> Configuration -> ESC/Motor Features -> set Motor Protocol to match your ESC.",
     "fw_002": "BLHeli_S ESCs cannot run DShot1200. Downgrade to DShot600 or lower, or upgrade ESC to BLHeli_32/AM32.",
@@ -286,14 +388,14 @@ FIX_SUGGESTIONS: dict[str, str] = {
     "fw_019": "Adjust iNav navigation speed settings for your drone class. Long range: 800-1200, whoop: 300-500.",
     "fw_020": "Set platform_type to AIRPLANE or FLYING_WING for fixed-wing drones in iNav.",
     # Discrepancy checks get suggestions from the Discrepancy.fix_suggestion field directly
-}
+})
 
 
 # ---------------------------------------------------------------------------
 # Resolution guides — structured multi-step fix instructions per check ID
 # ---------------------------------------------------------------------------
 
-RESOLUTION_GUIDES: dict[str, dict] = {
+RESOLUTION_GUIDES: Mapping[str, dict] = MappingProxyType({
     "disc_002": {
         "summary": "Receiver protocol mismatch between FC config and fleet record",
         "steps": [
@@ -474,7 +576,27 @@ RESOLUTION_GUIDES: dict[str, dict] = {
         "severity_note": "Undersized ESC will overheat and can burn out during aggressive flying.",
         "reference": "Motor thrust data tables and ESC specifications",
     },
+})
+
+
+class CheckInfo(NamedTuple):
+    """Help text for one check ID: fix suggestion and resolution guide."""
+
+    fix: str            # "" when the check has no fix suggestion
+    guide: dict | None  # None when the check has no resolution guide
+
+
+# Both lookups combined per check ID, built once at import.
+_CHECK_INFO: dict[str, CheckInfo] = {
+    check_id: CheckInfo(FIX_SUGGESTIONS.get(check_id, ""), RESOLUTION_GUIDES.get(check_id))
+    for check_id in (*FIX_SUGGESTIONS, *RESOLUTION_GUIDES)
 }
+_NO_CHECK_INFO = CheckInfo("", None)
+
+
+def get_check_info(check_id: str) -> CheckInfo:
+    """Get the fix suggestion and resolution guide for a check ID in one lookup."""
+    return _CHECK_INFO.get(check_id, _NO_CHECK_INFO)
 
 
 def get_resolution_guide(check_id: str) -> dict | None:
@@ -483,25 +605,13 @@ def get_resolution_guide(check_id: str) -> dict | None:
     Returns a dict with keys: summary, steps, severity_note, reference (optional),
     or None if no guide exists for the given check ID.
     """
-    return RESOLUTION_GUIDES.get(check_id)
+    return get_check_info(check_id).guide
 
 
 # ---------------------------------------------------------------------------
 # Prioritization
 # ---------------------------------------------------------------------------
 
-def _get_check_id(item: ValidationResult | Discrepancy) -> str:
-    """Extract the check ID from a result or discrepancy."""
-    if isinstance(item, Discrepancy):
-        return item.id
-    return item.constraint_id
-
-
-def _severity_order(severity: Severity) -> int:
-    """Lower number = higher priority."""
-    return {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}[severity]
-
-
 def prioritize_results(
     all_results: list[ValidationResult],
     discrepancies: list[Discrepancy],
@@ -515,41 +625,37 @@ def prioritize_results(
 
     Both lists are sorted by severity (CRITICAL > WARNING > INFO), then by check ID.
     """
-    # Collect all check IDs relevant to the reported symptoms
-    relevant_ids: set[str] = set()
+    # Bits of all check IDs relevant to the reported symptoms
+    relevant_mask = 0
     for symptom in symptoms:
-        relevant_ids.update(SYMPTOM_CHECKS.get(symptom, []))
-
-    # Combine failed results and discrepancies into one pool
-    all_items: list[ValidationResult | Discrepancy] = []
-
-    for r in all_results:
-        if not r.passed:
-            all_items.append(r)
-
-    all_items.extend(discrepancies)
-
-    # Partition
-    symptom_relevant: list[ValidationResult | Discrepancy] = []
-    other: list[ValidationResult | Discrepancy] = []
-
-    for item in all_items:
-        check_id = _get_check_id(item)
-        if check_id in relevant_ids:
-            symptom_relevant.append(item)
-        else:
-            other.append(item)
-
-    # Sort each group by severity, then ID
-    def sort_key(item: ValidationResult | Discrepancy) -> tuple[int, str]:
-        return (_severity_order(item.severity), _get_check_id(item))
-
-    symptom_relevant.sort(key=sort_key)
-    other.sort(key=sort_key)
-
+        relevant_mask |= _SYMPTOM_MASK.get(symptom, 0)
+
+    failed = (r for r in all_results if not r.passed)
+
+    # No symptoms (or none naming a check): everything is "other", so skip
+    # the per-item relevance lookup
+    if not relevant_mask:
+        decorated = [((item.severity.rank, item.check_id), item) for item in chain(failed, discrepancies)]
+        decorated.sort(key=itemgetter(0))
+        return [], [item for _, item in decorated]
+
+    # One pass over failed results and discrepancies: compute each item's
+    # sort key once and drop it into bucket 1 (relevant) or 0 (other)
+    buckets: tuple[list[tuple[tuple[int, str], ValidationResult | Discrepancy]], ...] = ([], [])
+
+    check_bit = _CHECK_BIT.get
+    for item in chain(failed, discrepancies):
+        check_id = item.check_id
+        relevant = (relevant_mask & check_bit(check_id, 0)) != 0
+        buckets[relevant].append(((item.severity.rank, check_id), item))
+
+    # Sort each group by severity, then ID (stable, on the precomputed keys)
+    for bucket in buckets:
+        bucket.sort(key=itemgetter(0))
+    other, symptom_relevant = ([item for _, item in bucket] for bucket in buckets)
     return symptom_relevant, other
 
 
 def get_fix_suggestion(check_id: str) -> str:
     """Get the fix suggestion for a given check ID."""
-    return FIX_SUGGESTIONS.get(check_id, "")
+    return get_check_info(check_id).fix
@@ -35,20 +35,29 @@ def exit_cli_mode(conn: FCConnection) -> None:
 
 
 def _read_until_prompt(conn: FCConnection, timeout: float) -> str:
-    """Read serial data until we see the '# ' prompt or timeout."""
-    buffer = b""
+    """Read serial data until we see the '# ' prompt or timeout.
+
+    Chunks are appended in place to one growing buffer and decoded once at
+    the end; the prompt check only looks at each new chunk, so long
+    ``diff all`` captures stay linear.
+    """
+    buffer = bytearray()
+    at_prompt = False
     deadline = time.monotonic() + timeout
 
     while time.monotonic() < deadline:
-        chunk = conn.read(1024)
+        # Takes whatever has arrived, or blocks (up to the connection's read
+        # timeout) for the next byte, so there is no need to poll and sleep
+        chunk = conn.read_all()
         if chunk:
             buffer += chunk
-            # Look for prompt at end of output
-            text = buffer.decode("utf-8", errors="replace")
-            if text.rstrip().endswith("# ") or text.rstrip().endswith("#"):
-                return text
-        else:
-            time.sleep(0.05)
-
-    # Return whatever we got before timeout
+            # Look for prompt at end of output; an all-whitespace chunk
+            # leaves the last non-whitespace byte where it was
+            content = chunk.rstrip()
+            if content:
+                at_prompt = content.endswith(b"#")
+            if at_prompt:
+                break
+
+    # Prompt seen, or whatever we got before timeout
     return buffer.decode("utf-8", errors="replace")
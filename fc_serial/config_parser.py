@@ -57,40 +57,60 @@ INAV_SERIAL_FUNCTIONS: dict[int, str] = {
     65536: "VTX_MSP",
 }
 
+# Function name by single set bit, without the "UNUSED" (0) entry
+_BTFL_FUNCTION_BITS: dict[int, str] = {b: n for b, n in BTFL_SERIAL_FUNCTIONS.items() if b}
+_INAV_FUNCTION_BITS: dict[int, str] = {b: n for b, n in INAV_SERIAL_FUNCTIONS.items() if b}
+
+
+# ---------------------------------------------------------------------------
+# Line patterns
+# ---------------------------------------------------------------------------
+
+_BOARD_NAME_RE = re.compile(r"#\s*board_name\s+(\S+)")
+_PROFILE_RE = re.compile(r"profile\s+(\d+)")
+_RATEPROFILE_RE = re.compile(r"rateprofile\s+(\d+)")
+_FEATURE_RE = re.compile(r"feature\s+(-?)(\S+)")
+
+# Field names of the seven numbers on an "aux" line, in order
+_AUX_FIELDS = ("index", "mode_id", "channel", "range_low", "range_high", "logic", "linked_to")
+
 
 def _decode_function_mask(mask: int, firmware: str) -> list[str]:
-    """Decode a serial port function bitmask to human-readable names."""
-    lookup = INAV_SERIAL_FUNCTIONS if firmware == "INAV" else BTFL_SERIAL_FUNCTIONS
+    """Decode a serial port function bitmask to human-readable names.
+
+    Walks only the bits that are set, lowest first; unknown bits are ignored.
+    """
+    by_bit = _INAV_FUNCTION_BITS if firmware == "INAV" else _BTFL_FUNCTION_BITS
     functions = []
-    for bit, name in sorted(lookup.items()):
-        if bit == 0:
-            continue
-        if mask & bit:
+    while mask:
+        lowest = mask & -mask
+        name = by_bit.get(lowest)
+        if name:
             functions.append(name)
+        mask ^= lowest
     return functions if functions else ["UNUSED"]
 
 
 def _parse_serial_line(line: str, firmware: str) -> SerialPortConfig | None:
     """Parse a 'serial <id> <mask> <baud1> <baud2> <baud3> <baud4>' line."""
-    match = re.match(
-        r"serial\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)",
-        line.strip(),
-    )
-    if not match:
+    fields = line.split()
+    if len(fields) < 7 or fields[0] != "serial":
+        return None
+    numbers = fields[1:7]
+    if not all(n.isdecimal() for n in numbers):
         return None
 
-    port_id = int(match.group(1))
-    function_mask = int(match.group(2))
+    port_id, function_mask, baud_msp, baud_gps, baud_telemetry, baud_peripheral = map(int, numbers)
     functions = _decode_function_mask(function_mask, firmware)
 
     return SerialPortConfig(
         port_id=port_id,
         function_mask=function_mask,
         functions=functions,
-        baud_msp=int(match.group(3)),
-        baud_gps=int(match.group(4)),
-        baud_telemetry=int(match.group(5)),
-        baud_peripheral=int(match.group(6)),
+        baud_msp=baud_msp,
+        baud_gps=baud_gps,
+        baud_telemetry=baud_telemetry,
+        baud_peripheral=baud_peripheral,
     )
 
 
@@ -120,88 +140,84 @@ def parse_diff_all(text: str) -> FCConfig:
 
         # Skip comments and empty lines
         if not stripped or stripped.startswith("#"):
-            # But check for board_name in comments
-            board_match = re.match(r"#\s*board_name\s+(\S+)", stripped)
-            if board_match and not config.board_name:
-                config.board_name = board_match.group(1)
+            # But check for board_name in comments, until one is known (the
+            # version header usually provides it, so this rarely matches)
+            if not config.board_name and "board_name" in stripped:
+                board_match = _BOARD_NAME_RE.match(stripped)
+                if board_match:
+                    config.board_name = board_match.group(1)
             continue
 
-        # Section headers
-        profile_match = re.match(r"profile\s+(\d+)", stripped)
-        if profile_match:
-            current_section = "profile"
-            current_profile_idx = int(profile_match.group(1))
-            # Ensure profile list is long enough
-            while len(config.pid_profiles) <= current_profile_idx:
-                config.pid_profiles.append(
-                    ParsedProfile(index=len(config.pid_profiles))
-                )
-            continue
+        # Each line type starts with its own keyword, so dispatch on the
+        # first token and handle only that line type. The common line types
+        # are plain whitespace-separated fields and are split, not matched.
+        fields = stripped.split(None, 1)
+        head = fields[0]
+        rest = fields[1] if len(fields) > 1 else ""
 
-        rateprofile_match = re.match(r"rateprofile\s+(\d+)", stripped)
-        if rateprofile_match:
-            current_section = "rateprofile"
-            current_rate_idx = int(rateprofile_match.group(1))
-            while len(config.rate_profiles) <= current_rate_idx:
-                config.rate_profiles.append(
-                    ParsedProfile(index=len(config.rate_profiles))
-                )
-            continue
+        # Section headers
+        if head == "profile":
+            profile_match = _PROFILE_RE.match(stripped)
+            if profile_match:
+                current_section = "profile"
+                current_profile_idx = int(profile_match.group(1))
+                # Ensure profile list is long enough
+                while len(config.pid_profiles) <= current_profile_idx:
+                    config.pid_profiles.append(
+                        ParsedProfile(index=len(config.pid_profiles))
+                    )
+
+        elif head == "rateprofile":
+            rateprofile_match = _RATEPROFILE_RE.match(stripped)
+            if rateprofile_match:
+                current_section = "rateprofile"
+                current_rate_idx = int(rateprofile_match.group(1))
+                while len(config.rate_profiles) <= current_rate_idx:
+                    config.rate_profiles.append(
+                        ParsedProfile(index=len(config.rate_profiles))
+                    )
 
         # Feature lines: "feature OSD" or "feature -TELEMETRY"
-        feature_match = re.match(r"feature\s+(-?)(\S+)", stripped)
-        if feature_match:
-            sign = feature_match.group(1)
-            feat_name = feature_match.group(2).upper()
-            if sign == "-":
-                config.features.discard(feat_name)
-            else:
-                config.features.add(feat_name)
-            continue
+        elif head == "feature":
+            feature_match = _FEATURE_RE.match(stripped)
+            if feature_match:
+                sign = feature_match.group(1)
+                feat_name = feature_match.group(2).upper()
+                if sign == "-":
+                    config.features.discard(feat_name)
+                else:
+                    config.features.add(feat_name)
 
         # Serial port lines
-        if stripped.startswith("serial "):
+        elif head == "serial":
             port = _parse_serial_line(stripped, firmware)
             if port:
                 config.serial_ports.append(port)
-            continue
 
         # Resource mappings: "resource MOTOR 1 B06"
-        resource_match = re.match(r"resource\s+(\S+)\s+(\S+)\s+(\S+)", stripped)
-        if resource_match:
-            key = f"{resource_match.group(1)} {resource_match.group(2)}"
-            config.resource_mappings[key] = resource_match.group(3)
-            continue
+        elif head == "resource":
+            parts = rest.split()
+            if len(parts) >= 3:
+                config.resource_mappings[f"{parts[0]} {parts[1]}"] = parts[2]
 
         # Aux mode lines: "aux 0 0 1 1700 2100 0 0"
-        aux_match = re.match(
-            r"aux\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)",
-            stripped,
-        )
-        if aux_match:
-            config.aux_modes.append({
-                "index": aux_match.group(1),
-                "mode_id": aux_match.group(2),
-                "channel": aux_match.group(3),
-                "range_low": aux_match.group(4),
-                "range_high": aux_match.group(5),
-                "logic": aux_match.group(6),
-                "linked_to": aux_match.group(7),
-            })
-            continue
+        elif head == "aux":
+            parts = rest.split()[:len(_AUX_FIELDS)]
+            if len(parts) == len(_AUX_FIELDS) and all(p.isdecimal() for p in parts):
+                config.aux_modes.append(dict(zip(_AUX_FIELDS, parts)))
 
         # Set lines: "set motor_pwm_protocol = DSHOT600"
-        set_match = re.match(r"set\s+(\S+)\s*=\s*(.*)", stripped)
-        if set_match:
-            key = set_match.group(1)
-            value = set_match.group(2).strip()
-
-            if current_section == "profile" and current_profile_idx < len(config.pid_profiles):
-                config.pid_profiles[current_profile_idx].settings[key] = value
-            elif current_section == "rateprofile" and current_rate_idx < len(config.rate_profiles):
-                config.rate_profiles[current_rate_idx].settings[key] = value
-            else:
-                config.master_settings[key] = value
-            continue
+        elif head == "set":
+            key, eq, value = rest.partition("=")
+            key = key.strip()
+            if eq and key and len(key.split()) == 1:
+                value = value.strip()
+
+                if current_section == "profile" and current_profile_idx < len(config.pid_profiles):
+                    config.pid_profiles[current_profile_idx].settings[key] = value
+                elif current_section == "rateprofile" and current_rate_idx < len(config.rate_profiles):
+                    config.rate_profiles[current_rate_idx].settings[key] = value
+                else:
+                    config.master_settings[key] = value
 
     return config
@@ -56,6 +56,7 @@ def detect_fc_ports() -> list[DetectedPort]:
 
         vid = port_info.vid
         pid = port_info.pid
+        device_lower = device.lower()
 
         if vid is not None and pid is not None:
             chip_desc = _FC_VID_PIDS.get((vid, pid))
@@ -72,7 +73,7 @@ def detect_fc_ports() -> list[DetectedPort]:
             else:
                 other_usb.append(port)
 
-        elif "usb" in device.lower() or "acm" in device.lower() or "ttyUSB" in device:
+        elif "usb" in device_lower or "acm" in device_lower:
             # No VID/PID but device path suggests USB serial
             other_usb.append(DetectedPort(
                 device=device,
@@ -152,11 +153,19 @@ class FCConnection:
 
     @property
     def in_waiting(self) -> int:
-        """Number of bytes in the input buffer."""
-        with self._lock:
-            if not self.is_open:
-                return 0
-            return self._serial.in_waiting
+        """Number of bytes in the input buffer.
+
+        Safe without the lock, so pollers never wait behind a blocking read
+        or write: the serial object is read once, and a port closed under us
+        counts as empty.
+        """
+        ser = self._serial
+        if ser is None or not ser.is_open:
+            return 0
+        try:
+            return ser.in_waiting
+        except OSError:  # includes pyserial's SerialException
+            return 0
 
     def __enter__(self) -> FCConnection:
         self.open()
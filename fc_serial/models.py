@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from functools import cached_property
+
+# Master settings holding integers that checks compare numerically
+_INT_SETTINGS = (
+    "vbat_max_cell_voltage",
+    "vbat_warning_cell_voltage",
+    "vbat_min_cell_voltage",
+    "pid_process_denom",
+    "gyro_lpf1_static_hz",
+    "rpm_filter_harmonics",
+    "vtx_table_bands",
+    "nav_mc_vel_xy_max",
+)
+_INT_RE = re.compile(r"\s*[+-]?\d+\s*")
 
 
 @dataclass
@@ -28,7 +43,11 @@ class ParsedProfile:
 
 @dataclass
 class FCConfig:
-    """Parsed flight controller configuration from `diff all` output."""
+    """Parsed flight controller configuration from `diff all` output.
+
+    Derived lookup tables (``function_index`` etc.) are built on first access,
+    so the config should not be mutated once parsing has finished.
+    """
 
     firmware: str  # "BTFL" or "INAV"
     firmware_version: str  # e.g. "4.5.1"
@@ -47,16 +66,70 @@ class FCConfig:
         """Look up a master setting by key name."""
         return self.master_settings.get(key, default)
 
+    @cached_property
+    def _features_upper(self) -> frozenset[str]:
+        return frozenset(f.upper() for f in self.features)
+
     def has_feature(self, feature: str) -> bool:
         """Check if a feature flag is enabled (case-insensitive)."""
-        return feature.upper() in {f.upper() for f in self.features}
+        return feature.upper() in self._features_upper
+
+    @cached_property
+    def craft_name(self) -> str:
+        """Craft name from the ``name`` setting, falling back to ``craft_name``."""
+        name = self.get_setting("name", "") or self.get_setting("craft_name", "")
+        return name.strip() if name else ""
+
+    @cached_property
+    def int_settings(self) -> dict[str, int | None]:
+        """Numeric master settings parsed once; None when unset or not an integer."""
+        parsed: dict[str, int | None] = {}
+        for key in _INT_SETTINGS:
+            value = self.master_settings.get(key)
+            parsed[key] = int(value) if value and _INT_RE.fullmatch(value) else None
+        return parsed
+
+    @property
+    def vbat_max_cell_cv(self) -> int | None:
+        """vbat_max_cell_voltage in centivolts (430 = 4.30V)."""
+        return self.int_settings["vbat_max_cell_voltage"]
+
+    @property
+    def vbat_warning_cell_cv(self) -> int | None:
+        """vbat_warning_cell_voltage in centivolts."""
+        return self.int_settings["vbat_warning_cell_voltage"]
+
+    @property
+    def vbat_min_cell_cv(self) -> int | None:
+        """vbat_min_cell_voltage in centivolts."""
+        return self.int_settings["vbat_min_cell_voltage"]
+
+    @cached_property
+    def function_index(self) -> dict[str, SerialPortConfig]:
+        """Map each serial function name to the first port that has it assigned."""
+        index: dict[str, SerialPortConfig] = {}
+        for port in self.serial_ports:
+            for function_name in port.functions:
+                index.setdefault(function_name, port)
+        return index
+
+    @cached_property
+    def resource_by_prefix(self) -> dict[str, tuple[str, ...]]:
+        """Group resource mapping keys by resource name (``"MOTOR"`` -> ``("MOTOR 1", ...)``)."""
+        grouped: dict[str, list[str]] = {}
+        for key in self.resource_mappings:
+            prefix = key.split(" ", 1)[0]
+            grouped.setdefault(prefix, []).append(key)
+        return {prefix: tuple(keys) for prefix, keys in grouped.items()}
+
+    @property
+    def motor_resource_count(self) -> int:
+        """Number of ``MOTOR n`` resource mappings (i.e. configured motor outputs)."""
+        return len(self.resource_by_prefix.get("MOTOR", ()))
 
     def get_serial_port_with_function(self, function_name: str) -> SerialPortConfig | None:
         """Find first serial port that has a given function assigned."""
-        for port in self.serial_ports:
-            if function_name in port.functions:
-                return port
-        return None
+        return self.function_index.get(function_name)
 
     def serial_ports_with_function(self, function_name: str) -> list[SerialPortConfig]:
         """Find all serial ports that have a given function assigned."""
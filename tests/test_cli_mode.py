@@ -0,0 +1,37 @@
+"""Tests for serial/cli_mode.py — reading CLI output up to the prompt."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from fc_serial.cli_mode import _read_until_prompt
+
+
+def _conn_with_chunks(*chunks: bytes) -> MagicMock:
+    """A connection whose read_all() returns *chunks* in order, then nothing."""
+    pending = list(chunks)
+    conn = MagicMock()
+    conn.read_all.side_effect = lambda: pending.pop(0) if pending else b""
+    return conn
+
+
+class TestReadUntilPrompt:
+    """Prompt detection across chunk boundaries."""
+
+    def test_stops_at_prompt(self):
+        conn = _conn_with_chunks(b"set a = 1\r\n", b"# ", b"never read")
+        assert _read_until_prompt(conn, timeout=1.0) == "set a = 1\r\n# "
+        assert conn.read_all.call_count == 2
+
+    def test_whitespace_chunk_is_not_a_prompt(self):
+        conn = _conn_with_chunks(b"# master", b"\r\n", b" \r\n", b"# ")
+        assert _read_until_prompt(conn, timeout=1.0) == "# master\r\n \r\n# "
+
+    def test_hash_inside_output_does_not_stop(self):
+        conn = _conn_with_chunks(b"# board_name", b" SPEEDYBEEF405V4\r\n", b"# ")
+        text = _read_until_prompt(conn, timeout=1.0)
+        assert text == "# board_name SPEEDYBEEF405V4\r\n# "
+
+    def test_returns_partial_output_on_timeout(self):
+        conn = _conn_with_chunks(b"set a = 1\r\n")
+        assert _read_until_prompt(conn, timeout=0.1) == "set a = 1\r\n"
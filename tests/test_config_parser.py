@@ -140,6 +140,8 @@ class TestParseDiffAll:
         config = parse_diff_all(BETAFLIGHT_DIFF)
         assert config.resource_mappings["MOTOR 1"] == "B06"
         assert config.resource_mappings["MOTOR 2"] == "B07"
+        assert config.resource_by_prefix["MOTOR"] == ("MOTOR 1", "MOTOR 2")
+        assert config.motor_resource_count == 2
 
     def test_inav_firmware_detected(self):
         config = parse_diff_all(INAV_DIFF)
@@ -175,6 +177,30 @@ class TestParseDiffAll:
         config = parse_diff_all("set motor_pwm_protocol = DSHOT300\n")
         assert config.master_settings["motor_pwm_protocol"] == "DSHOT300"
 
+    def test_lines_dispatched_on_whole_keyword(self):
+        config = parse_diff_all(
+            "settings foo = 1\n"
+            "profiles 3\n"
+            "serial\t1 64 115200 57600 0 115200\n"
+            "set\tdebug_mode = GYRO_SCALED\n"
+        )
+        assert config.master_settings == {"debug_mode": "GYRO_SCALED"}
+        assert config.pid_profiles == []
+        assert [p.port_id for p in config.serial_ports] == [1]
+
+    def test_malformed_field_lines_ignored(self):
+        config = parse_diff_all(
+            "set name = A=B\n"
+            "set orphan\n"
+            "aux 0 0 1 low 2100 0 0\n"
+            "resource MOTOR 1\n"
+            "serial 0 64 115200\n"
+        )
+        assert config.master_settings == {"name": "A=B"}
+        assert config.aux_modes == []
+        assert config.resource_mappings == {}
+        assert config.serial_ports == []
+
     def test_get_setting(self):
         config = parse_diff_all(BETAFLIGHT_DIFF)
         assert config.get_setting("motor_pwm_protocol") == "DSHOT600"
@@ -197,6 +223,22 @@ class TestParseDiffAll:
         assert port is not None
         assert port.port_id == 3
 
+    def test_int_settings(self):
+        config = parse_diff_all(BETAFLIGHT_DIFF)
+        assert config.vbat_max_cell_cv == 430
+        assert config.vbat_min_cell_cv == 330
+        assert config.vbat_warning_cell_cv is None
+
+    def test_int_settings_invalid_value(self):
+        config = parse_diff_all("set vbat_max_cell_voltage = high\n")
+        assert config.vbat_max_cell_cv is None
+
+    def test_function_index(self):
+        config = parse_diff_all(BETAFLIGHT_DIFF)
+        assert config.function_index["SERIAL_RX"].port_id == 0
+        assert config.function_index["VTX_SMARTAUDIO"].port_id == 2
+        assert "VTX_MSP" not in config.function_index
+
 
 class TestDecodeFunctionMask:
     """Test bitmask decoding."""
@@ -215,6 +257,12 @@ class TestDecodeFunctionMask:
         assert "MSP" in result
         assert "SERIAL_RX" in result
 
+    def test_lowest_bit_first_and_unknown_bits_ignored(self):
+        # SERIAL_RX (64) + MSP (1) + VTX_MSP (65536) + unassigned bit 2**20
+        result = _decode_function_mask(2**20 + 65536 + 64 + 1, "BTFL")
+        assert result == ["MSP", "SERIAL_RX", "VTX_MSP"]
+        assert _decode_function_mask(2**20, "BTFL") == ["UNUSED"]
+
     def test_vtx_smartaudio(self):
         result = _decode_function_mask(1024, "BTFL")
         assert "VTX_SMARTAUDIO" in result
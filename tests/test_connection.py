@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -153,6 +153,30 @@ class TestFCConnection:
         with pytest.raises(ConnectionError):
             conn.write(b"test")
 
+    @patch("serial.Serial")
+    def test_in_waiting_does_not_take_lock(self, mock_serial_class):
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.in_waiting = 12
+        mock_serial_class.return_value = mock_serial
+
+        conn = FCConnection("/dev/ttyACM0")
+        assert conn.in_waiting == 0
+        conn.open()
+        with conn._lock:  # e.g. another thread blocked in read()
+            assert conn.in_waiting == 12
+
+    @patch("serial.Serial")
+    def test_in_waiting_port_error_reads_as_empty(self, mock_serial_class):
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        type(mock_serial).in_waiting = PropertyMock(side_effect=OSError("port closed"))
+        mock_serial_class.return_value = mock_serial
+
+        conn = FCConnection("/dev/ttyACM0")
+        conn.open()
+        assert conn.in_waiting == 0
+
 
 class TestConnectionRegistry:
     """Module-level connection registry."""
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from core.models import Build, Component, Discrepancy, Severity
-from engines.discrepancy import detect_discrepancies
+from engines.discrepancy import detect_discrepancies, detect_discrepancies_batch
 from fc_serial.models import FCConfig, SerialPortConfig
 
 
@@ -105,6 +107,18 @@ class TestFCBoard:
         result = detect_discrepancies(config, build)
         assert _get_disc(result, "disc_001") is None
 
+    def test_at32_board(self):
+        config = _make_config(board_name="NEUTRONRCF435MINI")
+        build = _make_build(fc=_make_component("fc", {"mcu": "AT32F435"}))
+        result = detect_discrepancies(config, build)
+        assert _get_disc(result, "disc_001") is None
+
+    def test_full_part_number_mcu(self):
+        config = _make_config(board_name="MATEKF405")
+        build = _make_build(fc=_make_component("fc", {"mcu": "STM32F405RGT6"}))
+        result = detect_discrepancies(config, build)
+        assert _get_disc(result, "disc_001") is None
+
 
 class TestReceiverProtocol:
     """disc_002: Receiver protocol mismatch."""
@@ -482,3 +496,43 @@ class TestDetectDiscrepancies:
 
         result = detect_discrepancies(config, build)
         assert len(result) == 0
+
+
+class TestDetectDiscrepanciesBatch:
+    """Batch API returns the same results as per-pair calls, in order."""
+
+    def _pairs(self, n: int) -> list[tuple[FCConfig, Build]]:
+        pairs = []
+        for i in range(n):
+            provider = "CRSF" if i % 2 else "SBUS"
+            config = _make_config(master_settings={"serialrx_provider": provider})
+            build = _make_build(receiver=_make_component("receiver", {"output_protocol": "CRSF"}))
+            pairs.append((config, build))
+        return pairs
+
+    def test_small_batch_inline(self):
+        pairs = self._pairs(4)
+        results = detect_discrepancies_batch(pairs)
+        assert [[d.id for d in r] for r in results] == [["disc_002"], [], ["disc_002"], []]
+
+    def test_large_batch_inline_by_default(self):
+        pairs = self._pairs(80)
+        with patch("multiprocessing.Pool") as pool, patch("engines.discrepancy.ThreadPoolExecutor") as executor:
+            results = detect_discrepancies_batch(pairs)
+        pool.assert_not_called()
+        executor.assert_not_called()
+        assert len(results) == 80
+
+    def test_large_batch_processes_match_serial(self):
+        pairs = self._pairs(80)
+        expected = [[d.id for d in detect_discrepancies(c, b)] for c, b in pairs]
+        results = detect_discrepancies_batch(pairs, workers=2)
+        assert [[d.id for d in r] for r in results] == expected
+
+    def test_large_batch_threads_match_serial(self):
+        pairs = self._pairs(80)
+        expected = [[d.id for d in detect_discrepancies(c, b)] for c, b in pairs]
+        with patch("multiprocessing.Pool") as pool:
+            results = detect_discrepancies_batch(pairs, workers=2, use_threads=True)
+        pool.assert_not_called()
+        assert [[d.id for d in r] for r in results] == expected
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from fc_serial.models import FCConfig, SerialPortConfig
 from engines.fc_importer import (
+    clear_component_cache,
     suggest_fleet_drone_from_config,
     _detect_vtx_type,
     _extract_craft_name,
@@ -268,3 +271,32 @@ class TestBuildTags:
         config = _make_config(serial_ports=[_serial_port(2, ["GPS"])])
         tags = _build_tags(config, {"type": "none", "detail": ""}, "")
         assert "GPS" in tags
+
+
+# ---------------------------------------------------------------------------
+# Tests: component DB cache
+# ---------------------------------------------------------------------------
+
+
+class TestComponentCache:
+
+    def setup_method(self):
+        clear_component_cache()
+
+    def teardown_method(self):
+        clear_component_cache()
+
+    def test_components_loaded_once(self):
+        config = _make_config()
+        with patch("engines.fc_importer.load_components", return_value={}) as mock_load:
+            suggest_fleet_drone_from_config(config)
+            suggest_fleet_drone_from_config(config)
+        assert mock_load.call_count == 1
+
+    def test_clear_forces_reload(self):
+        config = _make_config()
+        with patch("engines.fc_importer.load_components", return_value={}) as mock_load:
+            suggest_fleet_drone_from_config(config)
+            clear_component_cache()
+            suggest_fleet_drone_from_config(config)
+        assert mock_load.call_count == 2
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from core.models import Build, Component, Severity
-from engines.firmware_validator import validate_firmware_config
+from engines.firmware_validator import validate_firmware_config, validate_firmware_config_batch
 from fc_serial.models import FCConfig, SerialPortConfig
 
 
@@ -254,6 +254,15 @@ class TestDJIMSP:
         assert len(fw008) == 1
         assert not fw008[0].passed
 
+    def test_analog_vtx_skipped(self):
+        serial_ports = [
+            SerialPortConfig(port_id=0, function_mask=1, functions=["MSP"]),
+        ]
+        config = _make_config(serial_ports=serial_ports)
+        build = _make_build(vtx=_make_component("vtx", {"type": "Analog", "system": "Analog"}))
+        report = validate_firmware_config(config, build)
+        assert not [r for r in report.results if r.constraint_id == "fw_008"]
+
 
 class TestBatteryVoltage:
     """fw_010: vbat_min_cell_voltage range."""
@@ -302,6 +311,12 @@ class TestPIDLoopRate:
         assert len(fw012) == 1
         assert not fw012[0].passed
 
+    def test_non_numeric_denom_skipped(self):
+        config = _make_config(master_settings={"pid_process_denom": "auto", "motor_pwm_protocol": "DSHOT600"})
+        build = _make_build()
+        report = validate_firmware_config(config, build)
+        assert not [r for r in report.results if r.constraint_id == "fw_012"]
+
 
 class TestOSDFeature:
     """fw_015: OSD feature enabled."""
@@ -375,6 +390,29 @@ class TestSerialConflicts:
         assert len(fw018) == 1
         assert not fw018[0].passed
 
+    def test_two_vtx_functions_conflict(self):
+        serial_ports = [
+            SerialPortConfig(port_id=2, function_mask=5121,
+                             functions=["MSP", "VTX_SMARTAUDIO", "VTX_TRAMP"]),
+        ]
+        config = _make_config(serial_ports=serial_ports)
+        build = _make_build()
+        report = validate_firmware_config(config, build)
+        fw018 = [r for r in report.results if r.constraint_id == "fw_018"]
+        assert not fw018[0].passed
+        assert "UART2: VTX_SMARTAUDIO + VTX_TRAMP" in fw018[0].message
+        assert "MSP" not in fw018[0].message
+
+    def test_msp_with_telemetry_no_conflict(self):
+        serial_ports = [
+            SerialPortConfig(port_id=1, function_mask=17, functions=["MSP", "TELEMETRY_MSP"]),
+        ]
+        config = _make_config(serial_ports=serial_ports)
+        build = _make_build()
+        report = validate_firmware_config(config, build)
+        fw018 = [r for r in report.results if r.constraint_id == "fw_018"]
+        assert fw018[0].passed
+
 
 class TestINAVNavSettings:
     """fw_019: iNav navigation settings."""
@@ -489,3 +527,87 @@ class TestValidateReport:
         # Serial RX assigned should pass
         fw005 = [r for r in report.results if r.constraint_id == "fw_005"]
         assert fw005[0].passed
+
+    def test_passed_results_not_shared_across_validations(self):
+        config = _make_config(master_settings={"motor_pwm_protocol": "DSHOT600"})
+        build = _make_build(esc=_make_component("esc", {"protocol": "DShot600"}))
+
+        first = validate_firmware_config(config, build)
+        fw001_a = next(r for r in first.results if r.constraint_id == "fw_001")
+        fw001_a.details["note"] = "edited by a consumer"
+
+        second = validate_firmware_config(config, build)
+        fw001_b = next(r for r in second.results if r.constraint_id == "fw_001")
+        assert fw001_a is not fw001_b
+        assert fw001_b.details == {}
+        assert fw001_b.message == "FC protocol DSHOT600 is compatible with ESC DShot600"
+
+    def test_passed_message_formats_each_value_as_given(self):
+        config = _make_config(master_settings={"vbat_max_cell_voltage": "430"})
+
+        def fw011_message(cell_count):
+            build = _make_build(battery=_make_component("battery", {"cell_count": cell_count}))
+            report = validate_firmware_config(config, build)
+            return next(r for r in report.results if r.constraint_id == "fw_011").message
+
+        assert fw011_message(6.0) == "Max cell voltage 4.30V is reasonable for 6.0S battery"
+        assert fw011_message(6) == "Max cell voltage 4.30V is reasonable for 6S battery"
+
+
+class TestEarlyExit:
+    """fail_fast / max_errors stop the run early."""
+
+    def _broken(self):
+        config = _make_config(master_settings={
+            "motor_pwm_protocol": "DSHOT1200",
+            "serialrx_provider": "SBUS",
+            "vbat_min_cell_voltage": "250",
+        })
+        build = _make_build(
+            esc=_make_component("esc", {"protocol": "DShot600"}),
+            receiver=_make_component("receiver", {"output_protocol": "CRSF"}),
+        )
+        return config, build
+
+    def test_default_runs_all_checks(self):
+        config, build = self._broken()
+        ids = [r.constraint_id for r in validate_firmware_config(config, build).results]
+        assert "fw_001" in ids
+        assert "fw_004" in ids
+        assert "fw_010" in ids
+
+    def test_fail_fast_stops_at_first_critical(self):
+        config, build = self._broken()
+        report = validate_firmware_config(config, build, fail_fast=True)
+        assert [r.constraint_id for r in report.results] == ["fw_001"]
+
+    def test_max_errors(self):
+        config, build = self._broken()
+        report = validate_firmware_config(config, build, max_errors=2)
+        failed = [r for r in report.results if not r.passed]
+        assert len(failed) == 2
+        assert failed[-1].constraint_id == "fw_004"
+
+    @pytest.mark.parametrize("max_errors", [0, -1])
+    def test_max_errors_below_one_rejected(self, max_errors):
+        config, build = self._broken()
+        with pytest.raises(ValueError, match="max_errors must be >= 1"):
+            validate_firmware_config(config, build, max_errors=max_errors)
+
+
+class TestValidateBatch:
+
+    def test_matches_single_validation(self):
+        good = _make_config(master_settings={"motor_pwm_protocol": "DSHOT600"})
+        bad = _make_config(master_settings={"motor_pwm_protocol": "DSHOT1200", "dshot_bidir": "ON"})
+        build = _make_build(esc=_make_component("esc", {"protocol": "DShot600", "firmware": "BLHeli_S"}))
+
+        reports = validate_firmware_config_batch([(good, build), (bad, build), (good, _make_build())])
+
+        assert len(reports) == 3
+        for report, config, bld in zip(reports, (good, bad, good), (build, build, _make_build())):
+            expected = validate_firmware_config(config, bld)
+            assert report.results == expected.results
+
+    def test_empty_batch(self):
+        assert validate_firmware_config_batch([]) == []
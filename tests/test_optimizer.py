@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import heapq
+import random
+
 import pytest
 
 from core.loader import load_constraints
 from core.models import Severity
-from core.resolver import evaluate_constraint
+from core.resolver import constraint_input_types, evaluate_constraint
 from engines.optimizer import (
     BuildSuggestion,
     OptimizationRequest,
+    clear_component_cache,
     optimize,
+    _affordable_columns,
+    _check_cost,
+    _critical_constraints,
+    _generate_candidates,
+    _get_pool_columns,
+    _score_candidates,
     suggest_quick,
     _SUB250_CONSTRAINT_IDS,
     _SUB250_CLASSES,
@@ -181,3 +193,102 @@ class TestCustomPriorities:
         if cheap_results and balanced_results:
             # With price-only priority the cheapest build should surface.
             assert cheap_results[0].total_cost <= balanced_results[0].total_cost + 50.0
+
+
+class TestComponentCache:
+    """Pool columns are extracted once per drone class and reused."""
+
+    def setup_method(self) -> None:
+        clear_component_cache()
+
+    def teardown_method(self) -> None:
+        clear_component_cache()
+
+    def test_components_loaded_once_per_class(self) -> None:
+        request = OptimizationRequest(drone_class="5inch", budget_usd=400.0)
+        with patch("engines.optimizer.load_components", return_value={}) as mock_load:
+            optimize(request)
+            optimize(request)
+        assert mock_load.call_count == 1
+
+    def test_clear_forces_reload(self) -> None:
+        request = OptimizationRequest(drone_class="5inch", budget_usd=400.0)
+        with patch("engines.optimizer.load_components", return_value={}) as mock_load:
+            optimize(request)
+            clear_component_cache()
+            optimize(request)
+        assert mock_load.call_count == 2
+
+    def test_constraints_loaded_once_per_class(self) -> None:
+        with patch("engines.optimizer.load_constraints", return_value=[]) as mock_load:
+            _critical_constraints("5inch")
+            _critical_constraints("5inch")
+        assert mock_load.call_count == 1
+
+
+class TestAffordableColumns:
+    """Pools are pruned to components that fit the budget with the cheapest rest."""
+
+    def test_prunes_expensive_components(self) -> None:
+        cols = _get_pool_columns("5inch")
+        cheapest = sum(min(p) for p in cols.price)
+        pruned = _affordable_columns(cols, cheapest + 50.0)
+        assert pruned is not None
+        for t, prices in enumerate(pruned.price):
+            others = cheapest - min(cols.price[t])
+            assert all(price + others <= cheapest + 50.0 + 1e-9 for price in prices)
+        assert sum(map(len, pruned.price)) < sum(map(len, cols.price))
+
+    def test_none_when_nothing_fits(self) -> None:
+        cols = _get_pool_columns("5inch")
+        cheapest = sum(min(p) for p in cols.price)
+        assert _affordable_columns(cols, cheapest - 1.0) is None
+
+
+class TestCriticalConstraintOrder:
+    """Critical constraints are evaluated cheapest check first."""
+
+    def test_sorted_by_check_cost(self) -> None:
+        costs = [_check_cost(c) for c in _critical_constraints("5inch")]
+        assert costs == sorted(costs)
+
+    def test_same_constraints_as_load_order(self) -> None:
+        expected = {
+            c.id for c in load_constraints()
+            if c.severity == Severity.CRITICAL and c.id not in _SUB250_CONSTRAINT_IDS
+        }
+        assert {c.id for c in _critical_constraints("5inch")} == expected
+
+
+class TestConstraintInputTypes:
+    """Constraint results are memoized on the components they read."""
+
+    def _constraint(self, constraint_id: str):
+        return next(c for c in load_constraints() if c.id == constraint_id)
+
+    def test_component_fields(self) -> None:
+        assert constraint_input_types(self._constraint("elec_003")) == ("esc", "motor")
+
+    def test_expression_fields(self) -> None:
+        assert set(constraint_input_types(self._constraint("proto_008"))) == {"vtx", "fc"}
+
+    def test_build_field_not_memoizable(self) -> None:
+        assert constraint_input_types(self._constraint("wt_001")) is None
+
+
+class TestScoreCandidatesPruning:
+    """Skipping candidates that cannot reach the top N keeps the same top N."""
+
+    @pytest.mark.parametrize("budget", [250.0, 400.0, 800.0])
+    def test_same_top_n_as_full_scoring(self, budget: float) -> None:
+        random.seed(7)
+        cols = _get_pool_columns("5inch")
+        candidates = _generate_candidates(cols, budget)
+        request = OptimizationRequest(drone_class="5inch", budget_usd=budget)
+        key = lambda s: s.score  # noqa: E731
+
+        full = _score_candidates(cols, candidates, request, len(candidates))
+        pruned = _score_candidates(cols, candidates, request, 10)
+
+        assert len(pruned) <= len(full)
+        assert heapq.nlargest(10, pruned, key=key) == heapq.nlargest(10, full, key=key)
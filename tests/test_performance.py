@@ -7,7 +7,7 @@ import math
 import pytest
 
 from core.loader import load_build
-from engines.performance import calculate_performance, PerformanceReport
+from engines.performance import calculate_performance, calculate_performance_batch, PerformanceReport
 
 
 # ---------------------------------------------------------------------------
@@ -222,3 +222,18 @@ class TestMissingComponents:
         })
         with pytest.raises(ValueError, match="battery"):
             calculate_performance(build)
+
+
+# ---------------------------------------------------------------------------
+# Test: batch calculation matches single-build results
+# ---------------------------------------------------------------------------
+
+class TestPerformanceBatch:
+    def test_batch_matches_single(self, build_5inch):
+        """Each batch report equals calculate_performance() for that build."""
+        other = load_build({**BUILD_5INCH_6S, "name": "Second"})
+        reports = calculate_performance_batch([build_5inch, other])
+        assert reports == [calculate_performance(build_5inch), calculate_performance(other)]
+
+    def test_batch_empty(self):
+        assert calculate_performance_batch([]) == []
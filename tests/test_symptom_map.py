@@ -11,6 +11,7 @@ from engines.symptom_map import (
     SYMPTOM_CHECKS,
     SYMPTOM_DESCRIPTIONS,
     SYMPTOMS,
+    get_check_info,
     get_fix_suggestion,
     get_resolution_guide,
     match_symptom,
@@ -47,6 +48,12 @@ class TestMappingIntegrity:
                     f"Invalid check ID '{check_id}' in symptom '{symptom}'"
                 )
 
+    def test_tables_are_read_only(self):
+        with pytest.raises(TypeError):
+            SYMPTOM_CHECKS["new_symptom"] = ("fw_001",)
+        with pytest.raises(TypeError):
+            SYMPTOMS["cant_arm"] = "changed"
+
     def test_no_duplicate_checks_per_symptom(self):
         """No symptom should have duplicate check IDs."""
         for symptom, checks in SYMPTOM_CHECKS.items():
@@ -70,6 +77,13 @@ class TestFixSuggestions:
         assert get_fix_suggestion("fw_001") != ""
         assert get_fix_suggestion("nonexistent") == ""
 
+    def test_get_check_info(self):
+        fix, guide = get_check_info("elec_001")
+        assert fix == get_fix_suggestion("elec_001")
+        assert guide is RESOLUTION_GUIDES["elec_001"]
+        assert get_check_info("fw_001").fix == FIX_SUGGESTIONS["fw_001"]
+        assert get_check_info("nonexistent") == ("", None)
+
 
 # ---------------------------------------------------------------------------
 # Prioritization
@@ -102,6 +116,10 @@ def _make_discrepancy(disc_id: str, severity: Severity) -> Discrepancy:
 class TestPrioritize:
     """prioritize_results splits into symptom-relevant and other."""
 
+    def test_check_id_shared_by_results_and_discrepancies(self):
+        assert _make_result("fw_001", Severity.CRITICAL, False).check_id == "fw_001"
+        assert _make_discrepancy("disc_004", Severity.WARNING).check_id == "disc_004"
+
     def test_splits_by_symptom(self):
         results = [
             _make_result("fw_001", Severity.CRITICAL, False),  # in motors_wont_spin
@@ -142,6 +160,17 @@ class TestPrioritize:
         assert len(relevant) == 0
         assert len(other) == 2
 
+    def test_unknown_symptom_all_in_other_sorted(self):
+        results = [
+            _make_result("fw_014", Severity.INFO, False),
+            _make_result("fw_001", Severity.CRITICAL, False),
+        ]
+        discrepancies = [_make_discrepancy("disc_002", Severity.CRITICAL)]
+
+        relevant, other = prioritize_results(results, discrepancies, ["not_a_symptom"])
+        assert relevant == []
+        assert [item.check_id for item in other] == ["disc_002", "fw_001", "fw_014"]
+
     def test_passed_results_excluded(self):
         """Passed results should not appear in either list."""
         results = [
@@ -309,6 +338,17 @@ class TestMatchSymptom:
         keys = [m[0] for m in matches]
         assert "short_flight_time" in keys
 
+    def test_keywords_match_inside_words(self):
+        """Keywords are substrings, so "arm" still matches inside "disarmed"."""
+        keys = [m[0] for m in match_symptom("stays disarmed")]
+        assert "cant_arm" in keys
+
+    def test_repeat_calls_return_independent_lists(self):
+        """Cached matches are copied, so mutating one result cannot leak."""
+        first = match_symptom("drone wont arm")
+        first.clear()
+        assert match_symptom("Drone wont arm ") != []
+
     def test_threshold_filters_low_scores(self):
         """Scores below 0.2 should not be returned."""
         matches = match_symptom("something vaguely related")